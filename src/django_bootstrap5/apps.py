@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+from .core import get_bootstrap_settings, preload_renderers
+
+
+class DjangoBootstrap5Config(AppConfig):
+    name = "django_bootstrap5"
+
+    def ready(self):
+        if get_bootstrap_settings().preload_renderers:
+            preload_renderers()
@@ -0,0 +1,306 @@
+from collections import OrderedDict
+from copy import copy
+from functools import partial
+from threading import Lock
+from time import monotonic
+
+from django.core.exceptions import EmptyResultSet
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.forms.models import ModelChoiceField, ModelChoiceIterator
+from django.utils.choices import BaseChoiceIterator
+from django.utils.translation import get_language
+
+from .core import get_bootstrap_settings
+from .html import RenderedSelectOptions
+
+
+class CachedChoices(BaseChoiceIterator):
+    """
+    Evaluated choices of a model choice field, optionally with their rendered options.
+
+    This is a choice iterator, so widgets take these choices as they are instead of normalizing them into a new list.
+    """
+
+    cache_options_html = False
+
+    def __init__(self, choices):
+        self.choices = list(choices)
+        self._rendered_options = None
+
+    def __iter__(self):
+        return iter(self.choices)
+
+    def __len__(self):
+        return len(self.choices)
+
+    def __getitem__(self, index):
+        return self.choices[index]
+
+    def get_rendered_options(self):
+        """Return the rendered options of these choices, rendering them on first use."""
+        if self._rendered_options is None:
+            self._rendered_options = RenderedSelectOptions(self.choices)
+        return self._rendered_options
+
+
+def get_static_choice_key(value, label):
+    """Return key of a choice or option group, with the classes of values and labels because `1 == True`."""
+    if isinstance(label, (list, tuple)):
+        label = tuple(get_static_choice_key(*choice) for choice in label)
+    return value.__class__, value, label.__class__, label
+
+
+def get_static_choices_key(choices):
+    """Return key that identifies a list of choices, or None if the choices cannot be used as a key."""
+    try:
+        key = tuple(get_static_choice_key(value, label) for value, label in choices)
+        hash(key)
+    except (TypeError, ValueError):
+        return None
+    # Labels may be translated or localized
+    return key, get_language()
+
+
+# Rendered options of lists of choices, most recently used last.
+_rendered_options = OrderedDict()
+_rendered_options_lock = Lock()
+
+
+def get_rendered_select_options(choices):
+    """Return the rendered options for choices, or None if the options of these choices are not reused."""
+    if isinstance(choices, CachedChoices):
+        return choices.get_rendered_options() if choices.cache_options_html else None
+    if isinstance(choices, BaseChoiceIterator):
+        # Lazy choices can change between renders
+        return None
+    key = get_static_choices_key(choices)
+    if key is None:
+        return None
+    with _rendered_options_lock:
+        rendered_options = _rendered_options.get(key)
+        if rendered_options is not None:
+            _rendered_options.move_to_end(key)
+            return rendered_options
+    rendered_options = RenderedSelectOptions(choices)
+    with _rendered_options_lock:
+        _rendered_options[key] = rendered_options
+        while len(_rendered_options) > get_bootstrap_settings().cached_choices_maxsize:
+            _rendered_options.popitem(last=False)
+    return rendered_options
+
+
+def get_choices_key(choices):
+    """Return key that identifies the choices of a `ModelChoiceIterator`, or None if they cannot be cached."""
+    field = choices.field
+    queryset = field.queryset
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    label_from_instance = getattr(field.label_from_instance, "__func__", field.label_from_instance)
+    key = (
+        choices.__class__,
+        field.__class__,
+        field.empty_label,
+        field.to_field_name,
+        label_from_instance,
+        queryset.db,
+        sql,
+        params,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def evaluate_choices(choices):
+    """Return `CachedChoices` with the choices of a `ModelChoiceIterator`."""
+    # Iterate instead of calling `list(choices)`, which would count the queryset first
+    return CachedChoices(iter(choices))
+
+
+class ChoiceCache:
+    """
+    Evaluated choices of model choice fields, shared by the fields of one or more renders.
+
+    Each distinct queryset is evaluated once, the fields of all forms in a formset then reuse its choices.
+    """
+
+    def __init__(self):
+        self._choices = {}
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._choices)
+
+    def get_choices(self, choices):
+        """Return the evaluated choices of a `ModelChoiceIterator`, or None if they cannot be cached."""
+        key = get_choices_key(choices)
+        if key is None:
+            return None
+        with self._lock:
+            cached_choices = self._choices.get(key)
+        if cached_choices is None:
+            cached_choices = evaluate_choices(choices)
+            # This cache lives as long as a render, reuse the rendered options for every field
+            cached_choices.cache_options_html = True
+            with self._lock:
+                cached_choices = self._choices.setdefault(key, cached_choices)
+        return cached_choices
+
+    def get_widget(self, widget):
+        """Return copy of widget with cached choices, or the widget itself if its choices are not cached."""
+        choices = getattr(widget, "choices", None)
+        if not isinstance(choices, ModelChoiceIterator):
+            return widget
+        cached_choices = self.get_choices(choices)
+        if cached_choices is None:
+            return widget
+        widget = copy(widget)
+        widget.choices = cached_choices
+        return widget
+
+
+class SharedChoiceCache(ChoiceCache):
+    """
+    Process-level cache of choices of model choice fields, with a time to live and a maximum number of entries.
+
+    Entries of a model are removed when an instance of the model is saved or deleted, or a many-to-many relation of
+    the model changes, and again when the transaction commits. Other changes only expire through the time to live.
+    Use `register_cached_choices` or `cached_choices` to select the fields that use this cache.
+    """
+
+    def __init__(self):
+        self._choices = OrderedDict()
+        self._lock = Lock()
+
+    def get_choices(self, choices):
+        """Return the evaluated choices of a `ModelChoiceIterator`, or None if they cannot be cached."""
+        key = get_choices_key(choices)
+        if key is None:
+            return None
+        # Labels may be translated
+        key = (key, get_language())
+        bootstrap_settings = get_bootstrap_settings()
+        now = monotonic()
+        with self._lock:
+            entry = self._choices.get(key)
+            if entry is not None:
+                expires, _model, cached_choices = entry
+                if expires > now:
+                    self._choices.move_to_end(key)
+                    return cached_choices
+                del self._choices[key]
+        field = choices.field
+        cached_choices = evaluate_choices(choices)
+        cached_choices.cache_options_html = getattr(field, "cache_options_html", False) or _cached_choices_models.get(
+            field.queryset.model, False
+        )
+        with self._lock:
+            self._choices[key] = (now + bootstrap_settings.cached_choices_ttl, field.queryset.model, cached_choices)
+            while len(self._choices) > bootstrap_settings.cached_choices_maxsize:
+                self._choices.popitem(last=False)
+        return cached_choices
+
+    def invalidate(self, model):
+        """Remove all entries with choices of the given model."""
+        with self._lock:
+            for key in [
+                key for key, (_expires, entry_model, _choices) in self._choices.items() if entry_model is model
+            ]:
+                del self._choices[key]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._choices.clear()
+
+
+shared_choice_cache = SharedChoiceCache()
+
+# Models with invalidation of their cached choices, mapped to whether all their fields also cache their options HTML.
+_cached_choices_models = {}
+
+# Models for which the choices of all model choice fields are cached.
+_registered_models = set()
+
+
+def register_cached_choices(model, *, cache_options_html=False):
+    """
+    Cache the choices of all model choice fields for this model in the process-level `SharedChoiceCache`.
+
+    Set `cache_options_html` to also reuse the rendered options, this requires the `python_widget_rendering` setting.
+    """
+    _registered_models.add(model)
+    _cached_choices_models[model] = cache_options_html
+
+
+def unregister_cached_choices(model):
+    """Stop caching the choices of model choice fields for this model."""
+    _registered_models.discard(model)
+    _cached_choices_models.pop(model, None)
+    shared_choice_cache.invalidate(model)
+
+
+def cached_choices(field, *, cache_options_html=False):
+    """Mark a model choice field to take its choices from the process-level `SharedChoiceCache`, return the field."""
+    if not isinstance(field, ModelChoiceField):
+        raise TypeError('Parameter "field" should contain a valid Django ModelChoiceField.')
+    field.cached_choices = True
+    field.cache_options_html = cache_options_html
+    _cached_choices_models.setdefault(field.queryset.model, False)
+    return field
+
+
+def get_field_choice_cache(field, choice_cache=None):
+    """Return the choice cache to take the choices of a form field from, or None if its choices are not cached."""
+    if isinstance(field, ModelChoiceField) and (
+        getattr(field, "cached_choices", False) or field.queryset.model in _registered_models
+    ):
+        return shared_choice_cache
+    return choice_cache
+
+
+def get_choice_cache(kwargs):
+    """Return choice cache from kwargs, a new one if `cache_choices` is set, or None."""
+    choice_cache = kwargs.get("choice_cache", None)
+    if choice_cache is None and kwargs.get("cache_choices", False):
+        choice_cache = ChoiceCache()
+    return choice_cache
+
+
+def invalidate_model_choices(model, using):
+    """Remove cached choices of a model now, and again when the transaction of the change commits."""
+    shared_choice_cache.invalidate(model)
+    # Another thread may cache the old rows before the change is committed
+    transaction.on_commit(partial(shared_choice_cache.invalidate, model), using=using)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_cached_choices(sender, using, **kwargs):
+    """Remove cached choices of a model when one of its instances is saved or deleted."""
+    if sender in _cached_choices_models:
+        invalidate_model_choices(sender, using)
+
+
+@receiver(m2m_changed)
+def invalidate_cached_choices_on_m2m_changed(sender, instance, model, using, **kwargs):
+    """Remove cached choices of the models on both sides of a changed many-to-many relation."""
+    for changed_model in (instance.__class__, model):
+        if changed_model in _cached_choices_models:
+            invalidate_model_choices(changed_model, using)
+
+
+@receiver(setting_changed)
+def clear_cached_choices_on_setting_changed(*, setting, **kwargs):
+    """Remove all cached choices when the BOOTSTRAP5 setting changes, and rendered options when any setting changes."""
+    if setting == "BOOTSTRAP5":
+        shared_choice_cache.clear()
+    with _rendered_options_lock:
+        _rendered_options.clear()
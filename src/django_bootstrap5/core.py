@@ -1,6 +1,10 @@
 from importlib import import_module
+from types import MappingProxyType
 
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 BOOTSTRAP5_DEFAULTS = {
     "css_url": {
@@ -36,8 +40,59 @@ BOOTSTRAP5_DEFAULTS = {
         "default": "django_bootstrap5.renderers.FieldRenderer",
     },
     "hyphenate_attribute_prefixes": ["data"],
+    "preload_renderers": False,
+    "python_widget_rendering": False,
+    "cached_choices_ttl": 300,
+    "cached_choices_maxsize": 128,
 }
 
+RENDERER_KINDS = ("formset", "form", "field")
+
+
+class BootstrapSettings:
+    """
+    Immutable snapshot of the `django-bootstrap5` settings.
+
+    Every setting is available as a plain attribute, values from Django settings take precedence over defaults.
+    """
+
+    def __init__(self, bootstrap5_settings):
+        values = MappingProxyType({**BOOTSTRAP5_DEFAULTS, **bootstrap5_settings})
+        object.__setattr__(self, "_values", values)
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def get(self, name, default=None):
+        """Return value of setting, or given default if the setting does not exist."""
+        return self._values.get(name, default)
+
+
+_bootstrap_settings = None
+_renderer_classes = {}
+
+
+def get_bootstrap_settings():
+    """Return the `BootstrapSettings` snapshot, building it on first use."""
+    global _bootstrap_settings
+    if _bootstrap_settings is None:
+        _bootstrap_settings = BootstrapSettings(getattr(settings, "BOOTSTRAP5", {}))
+    return _bootstrap_settings
+
+
+@receiver(setting_changed)
+def reset_bootstrap_settings(*, setting, **kwargs):
+    """Throw away the settings snapshot and resolved renderer classes when the BOOTSTRAP5 setting changes."""
+    global _bootstrap_settings
+    if setting == "BOOTSTRAP5":
+        _bootstrap_settings = None
+        _renderer_classes.clear()
+
 
 def get_bootstrap_setting(name, default=None):
     """
@@ -49,23 +104,22 @@ def get_bootstrap_setting(name, default=None):
     2. `django-bootstrap5` defaults
     3. Given default value
     """
-    bootstrap5_settings = getattr(settings, "BOOTSTRAP5", {})
-    return bootstrap5_settings.get(name, BOOTSTRAP5_DEFAULTS.get(name, default))
+    return get_bootstrap_settings().get(name, default)
 
 
 def javascript_url():
     """Return the full url to the Bootstrap JavaScript file."""
-    return get_bootstrap_setting("javascript_url")
+    return get_bootstrap_settings().javascript_url
 
 
 def css_url():
     """Return the full url to the Bootstrap CSS file."""
-    return get_bootstrap_setting("css_url")
+    return get_bootstrap_settings().css_url
 
 
 def theme_url():
     """Return the full url to the theme CSS file."""
-    return get_bootstrap_setting("theme_url")
+    return get_bootstrap_settings().theme_url
 
 
 def get_renderer(renderers, **kwargs):
@@ -75,16 +129,37 @@ def get_renderer(renderers, **kwargs):
     return getattr(import_module(mod), cls)
 
 
+def get_cached_renderer(kind, layout=""):
+    """Return renderer class of given kind ("formset", "form" or "field") for layout, resolving it on first use."""
+    key = (kind, layout)
+    try:
+        return _renderer_classes[key]
+    except KeyError:
+        renderers = getattr(get_bootstrap_settings(), f"{kind}_renderers")
+        renderer_cls = _renderer_classes[key] = get_renderer(renderers, layout=layout)
+        return renderer_cls
+
+
+def preload_renderers():
+    """Resolve all configured renderer classes, raise `ImproperlyConfigured` for an invalid dotted path."""
+    for kind in RENDERER_KINDS:
+        setting_name = f"{kind}_renderers"
+        for layout in ["", *getattr(get_bootstrap_settings(), setting_name)]:
+            try:
+                get_cached_renderer(kind, layout)
+            except (ImportError, AttributeError, ValueError) as e:
+                raise ImproperlyConfigured(
+                    f'Cannot resolve renderer for layout "{layout}" in BOOTSTRAP5["{setting_name}"]: {e}'
+                ) from e
+
+
 def get_formset_renderer(**kwargs):
-    renderers = get_bootstrap_setting("formset_renderers")
-    return get_renderer(renderers, **kwargs)
+    return get_cached_renderer("formset", kwargs.get("layout", ""))
 
 
 def get_form_renderer(**kwargs):
-    renderers = get_bootstrap_setting("form_renderers")
-    return get_renderer(renderers, **kwargs)
+    return get_cached_renderer("form", kwargs.get("layout", ""))
 
 
 def get_field_renderer(**kwargs):
-    renderers = get_bootstrap_setting("field_renderers")
-    return get_renderer(renderers, **kwargs)
+    return get_cached_renderer("field", kwargs.get("layout", ""))
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django_bootstrap5.text import text_value
 
 
@@ -11,9 +13,25 @@ def _css_class_list_string(list_of_css_classes):
     return " ".join(_css_class_list(list_of_css_classes))
 
 
-def merge_css_classes(*args):
-    """Return single string with CSS classes."""
+def _merge_css_classes(args):
+    """Return single string with CSS classes, without caching."""
     css_classes = []
     for arg in args:
         css_classes += text_value(arg).split(" ")
     return _css_class_list_string(css_classes)
+
+
+# Calls with only `str` or `None` arguments are cached, the same small set of class strings is merged for every field.
+_merge_cached_css_classes = lru_cache(maxsize=1024)(_merge_css_classes)
+
+
+def merge_css_classes(*args):
+    """Return single string with CSS classes."""
+    if len(args) == 1:
+        arg = args[0]
+        if type(arg) is str and " " not in arg:
+            return arg
+    for arg in args:
+        if arg is not None and type(arg) is not str:
+            return _merge_css_classes(args)
+    return _merge_cached_css_classes(args)
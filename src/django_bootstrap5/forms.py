@@ -1,3 +1,12 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.utils.safestring import mark_safe
+
+from .choices import ChoiceCache, get_choice_cache
 from .core import get_field_renderer, get_form_renderer, get_formset_renderer
 from .html import render_tag
 
@@ -8,6 +17,89 @@ def render_formset(formset, **kwargs):
     return renderer_cls(formset, **kwargs).render()
 
 
+def iter_render_formset(formset, **kwargs):
+    """Render a formset to a Bootstrap layout, yielding management form, errors and each form in order."""
+    renderer_cls = get_formset_renderer(**kwargs)
+    return renderer_cls(formset, **kwargs).iter_render()
+
+
+# Number of rendered parts (forms of a formset, fields of a form) per handoff to a thread in the async generators.
+ASYNC_BATCH_SIZE = 10
+
+
+async def aiter_render_batches(iter_render, batch_size=ASYNC_BATCH_SIZE):
+    """Yield the parts of a render generator joined per batch, each batch is rendered in the sync thread."""
+    parts = None
+
+    def render_batch():
+        nonlocal parts
+        if parts is None:
+            parts = iter_render()
+        return list(islice(parts, batch_size))
+
+    def close():
+        # Close the render generator, and a thread pool of a parallel render, when iteration stops early
+        if parts is not None and hasattr(parts, "close"):
+            parts.close()
+
+    render_batch = sync_to_async(render_batch, thread_sensitive=True)
+    try:
+        while batch := await render_batch():
+            yield mark_safe("".join(batch))
+    finally:
+        await sync_to_async(close, thread_sensitive=True)()
+
+
+# Threads for rendering from async code. Renders are CPU bound, more threads than CPUs only add contention.
+render_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="django_bootstrap5")
+
+
+async def arender(renderer_cls, obj, **kwargs):
+    """
+    Render a form, formset or field with a renderer class in two thread handoffs.
+
+    The renderer is constructed and does its blocking work (validation, model choice queries) in the sync thread, the
+    render itself runs in `render_executor`, so concurrent renders do not hold up other work for the sync thread.
+    """
+    kwargs["choice_cache"] = get_choice_cache(kwargs) or ChoiceCache()
+
+    def prefetch():
+        renderer = renderer_cls(obj, **kwargs)
+        renderer.prefetch()
+        return renderer
+
+    def render(renderer):
+        try:
+            return renderer.render()
+        finally:
+            connections.close_all()
+
+    renderer = await sync_to_async(prefetch, thread_sensitive=True)()
+    return await sync_to_async(render, thread_sensitive=False, executor=render_executor)(renderer)
+
+
+async def arender_formset(formset, **kwargs):
+    """Render a formset to a Bootstrap layout from async code."""
+    return await arender(get_formset_renderer(**kwargs), formset, **kwargs)
+
+
+def aiter_render_formset(formset, *, batch_size=ASYNC_BATCH_SIZE, **kwargs):
+    """Render a formset to a Bootstrap layout, asynchronously yielding the parts of `iter_render_formset` in batches."""
+    return aiter_render_batches(lambda: iter_render_formset(formset, **kwargs), batch_size)
+
+
+def render_formset_forms(formset, **kwargs):
+    """Render the forms of a formset to a Bootstrap layout, without management form and errors."""
+    renderer_cls = get_formset_renderer(**kwargs)
+    return renderer_cls(formset, **kwargs).render_forms()
+
+
+def render_formset_empty_form(formset, **kwargs):
+    """Render the empty form of a formset to a Bootstrap layout, with `__prefix__` in place of the form index."""
+    renderer_cls = get_formset_renderer(**kwargs)
+    return renderer_cls(formset, **kwargs).render_empty_form()
+
+
 def render_formset_errors(formset, **kwargs):
     """Render formset errors to a Bootstrap layout."""
     renderer_cls = get_formset_renderer(**kwargs)
@@ -20,6 +112,22 @@ def render_form(form, **kwargs):
     return renderer_cls(form, **kwargs).render()
 
 
+def iter_render_form(form, **kwargs):
+    """Render a form to a Bootstrap layout, yielding errors and each field in order."""
+    renderer_cls = get_form_renderer(**kwargs)
+    return renderer_cls(form, **kwargs).iter_render()
+
+
+async def arender_form(form, **kwargs):
+    """Render a form to a Bootstrap layout from async code."""
+    return await arender(get_form_renderer(**kwargs), form, **kwargs)
+
+
+def aiter_render_form(form, *, batch_size=ASYNC_BATCH_SIZE, **kwargs):
+    """Render a form to a Bootstrap layout, asynchronously yielding the parts of `iter_render_form` in batches."""
+    return aiter_render_batches(lambda: iter_render_form(form, **kwargs), batch_size)
+
+
 def render_form_errors(form, *, type="all", **kwargs):
     """Render form errors to a Bootstrap layout."""
     renderer_cls = get_form_renderer(**kwargs)
@@ -32,6 +140,11 @@ def render_field(field, **kwargs):
     return renderer_cls(field, **kwargs).render()
 
 
+async def arender_field(field, **kwargs):
+    """Render a field to a Bootstrap layout from async code."""
+    return await arender(get_field_renderer(**kwargs), field, **kwargs)
+
+
 def render_label(
     content,
     *,
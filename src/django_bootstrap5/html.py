@@ -1,10 +1,12 @@
 from copy import copy
 
 from django.forms.utils import flatatt
-from django.utils.html import format_html, format_html_join
+from django.utils.formats import localize
+from django.utils.html import conditional_escape, format_html, format_html_join
 from django.utils.safestring import mark_safe
 
-from django_bootstrap5.core import get_bootstrap_setting
+from django_bootstrap5.core import get_bootstrap_settings
+from django_bootstrap5.css import _css_class_list, merge_css_classes
 from django_bootstrap5.text import text_value
 from django_bootstrap5.utils import get_url_attrs
 
@@ -35,7 +37,7 @@ def hyphenate(attr_name):
 
 def render_tag(tag, attrs=None, content=None, close=True):
     """Render an HTML tag."""
-    prefixes = get_bootstrap_setting("hyphenate_attribute_prefixes") or []
+    prefixes = get_bootstrap_settings().hyphenate_attribute_prefixes or []
     if attrs:
         for attr_name, attr_value in copy(attrs).items():
             if has_prefix(attr_name, prefixes):
@@ -52,3 +54,191 @@ def render_tag(tag, attrs=None, content=None, close=True):
 def render_multi_line_html(html_lines=[]):
     """Render a list of multiple lines of HTML as one block."""
     return format_html_join("\n", "{}", ((html_line,) for html_line in html_lines))
+
+
+def render_template_value(value):
+    """Render a value like the template tag `{{ value }}` with autoescaping."""
+    return conditional_escape(localize(value))
+
+
+def render_template_string(value):
+    """Render a value like the template tag `{{ value|stringformat:'s' }}` with autoescaping."""
+    return conditional_escape(str(value))
+
+
+def render_widget_attrs(attrs):
+    """Render widget attributes like the Django template `django/forms/widgets/attrs.html`."""
+    return "".join(
+        f" {conditional_escape(name)}"
+        if value is True
+        else f' {conditional_escape(name)}="{render_template_string(value)}"'
+        for name, value in attrs.items()
+        if value is not False
+    )
+
+
+def render_input_widget(widget):
+    """Render the context of an `Input` widget like the Django template `django/forms/widgets/input.html`."""
+    value = widget["value"]
+    value_attr = "" if value is None else f' value="{render_template_string(value)}"'
+    return mark_safe(
+        f'<input type="{render_template_value(widget["type"])}" name="{render_template_value(widget["name"])}"'
+        f"{value_attr}{render_widget_attrs(widget['attrs'])}>"
+    )
+
+
+def render_textarea_widget(widget):
+    """Render the context of a `Textarea` widget like the Django template `django/forms/widgets/textarea.html`."""
+    name = render_template_value(widget["name"])
+    value = render_template_value(widget["value"]) if widget["value"] else ""
+    return mark_safe(f'<textarea name="{name}"{render_widget_attrs(widget["attrs"])}>\n{value}</textarea>')
+
+
+def render_select_widget(widget):
+    """Render the context of a `Select` widget like the Django template `django/forms/widgets/select.html`."""
+    parts = [f'<select name="{render_template_value(widget["name"])}"{render_widget_attrs(widget["attrs"])}>']
+    rendered_options = widget.get("rendered_options")
+    if rendered_options is not None:
+        parts.append(rendered_options.render(widget["value"], widget["allow_multiple_selected"]))
+        parts.append("\n</select>")
+        return mark_safe("".join(parts))
+    append = parts.append
+    for group_name, group_choices, _group_index in widget["optgroups"]:
+        if group_name:
+            append(f'\n  <optgroup label="{render_template_value(group_name)}">')
+        # Options are rendered in one batch, an option without attrs is neither selected nor customized
+        parts.extend(
+            f'\n  <option value="{render_template_string(option["value"])}"'
+            f"{render_widget_attrs(option['attrs']) if option['attrs'] else ''}>"
+            f"{render_template_value(option['label'])}</option>\n"
+            for option in group_choices
+        )
+        if group_name:
+            append("\n  </optgroup>")
+    append("\n</select>")
+    return mark_safe("".join(parts))
+
+
+def render_radio_select_widget(widget):
+    """Render the context of a widget like the template `django_bootstrap5/widgets/radio_select.html`."""
+    attrs = widget["attrs"]
+    widget_class = attrs.get("class")
+    server_side_validation_class = (
+        " ".join(css_class for css_class in _css_class_list([widget_class]) if css_class in ["is-valid", "is-invalid"])
+        if "class" in attrs
+        else ""
+    )
+    input_class = render_template_value(merge_css_classes("form-check-input", server_side_validation_class))
+    id_attr = f' id="{render_template_value(attrs["id"])}"' if attrs.get("id") else ""
+    class_attr = f' class="{render_template_value(widget_class)}"' if widget_class else ""
+    parts = [f"<div{id_attr}{class_attr}>\n    "]
+    append = parts.append
+    for group, options, _index in widget["optgroups"]:
+        append("\n        ")
+        if group:
+            append(f"\n            <div>{render_template_value(group)}</div>")
+        append("\n        ")
+        for option in options:
+            option_attrs = option["attrs"]
+            value = option["value"]
+            value_attr = "" if value is None else f' value="{render_template_string(value)}"'
+            attrs_html = render_widget_attrs({name: value for name, value in option_attrs.items() if name != "class"})
+            option_id = render_template_value(option_attrs.get("id", ""))
+            append(
+                f'\n            <div class="form-check">\n                <input class="{input_class}"\n'
+                f'                       type="{render_template_value(option["type"])}"\n'
+                f'                       name="{render_template_value(option["name"])}"\n'
+                f"                        {value_attr}\n                        {attrs_html}>\n"
+                f'                <label class="form-check-label" for="{option_id}">'
+                f"{render_template_value(option['label'])}</label>\n            </div>\n        "
+            )
+        append("\n    ")
+    append("\n</div>")
+    return mark_safe("".join(parts))
+
+
+def render_radio_select_button_group_widget(widget):
+    """Render the context of a widget like the template `django_bootstrap5/widgets/radio_select_button_group.html`."""
+    attrs = widget["attrs"]
+    id_attr = f' id="{render_template_value(attrs["id"])}"' if attrs.get("id") else ""
+    input_class = render_template_value(attrs.get("class", "") + " btn-check")
+    btn_size_class = f" {render_template_value(attrs['btn_size_class'])}" if attrs.get("btn_size_class") else ""
+    required_attr = " required" if widget["required"] else ""
+    parts = [f'<div{id_attr} class="btn-group" role="group">\n  ']
+    append = parts.append
+    for _group, options, _index in widget["optgroups"]:
+        append("\n    ")
+        for option in options:
+            option_attrs = option["attrs"]
+            option_id = render_template_value(option_attrs.get("id", ""))
+            value = option["value"]
+            if value is None:
+                value_attr = ""
+            else:
+                checked_attr = ' checked="checked"' if option_attrs.get("checked") else ""
+                value_attr = f' value="{render_template_string(value)}"\n              {checked_attr}'
+            disabled_attr = " disabled" if attrs.get("disabled") or option_attrs.get("disabled") else ""
+            append(
+                f'\n      <input type="{render_template_value(option["type"])}"\n'
+                f'             class="{input_class}"\n'
+                f'             autocomplete="off"\n'
+                f'             name="{render_template_value(option["name"])}"\n'
+                f'             id="{option_id}"\n'
+                f"             {value_attr}\n"
+                f"             {disabled_attr}\n"
+                f"             {required_attr}>\n"
+                f'      <label class="btn btn-outline-primary{btn_size_class}" for="{option_id}">'
+                f"{render_template_value(option['label'])}</label>\n    "
+            )
+        append("\n  ")
+    append("\n</div>")
+    return mark_safe("".join(parts))
+
+
+class RenderedSelectOptions:
+    """
+    Rendered options of a set of choices, like the Django templates `select.html` and `select_option.html`.
+
+    The options are rendered once, only the selected options are rendered again for each value.
+    """
+
+    def __init__(self, choices):
+        parts = []
+        options = {}
+        indexes = {}
+        for option_value, option_label in choices:
+            if option_value is None:
+                option_value = ""
+            if isinstance(option_label, (list, tuple)):
+                group_name = option_value
+                group_choices = option_label
+            else:
+                group_name = None
+                group_choices = [(option_value, option_label)]
+            if group_name:
+                parts.append(f'\n  <optgroup label="{render_template_value(group_name)}">')
+            for subvalue, sublabel in group_choices:
+                head = f'\n  <option value="{render_template_string(subvalue)}"'
+                tail = f">{render_template_value(sublabel)}</option>\n"
+                indexes.setdefault(str(subvalue), []).append(len(parts))
+                options[len(parts)] = (head, tail)
+                parts.append(head + tail)
+            if group_name:
+                parts.append("\n  </optgroup>")
+        self.parts = parts
+        self.options = options
+        self.indexes = indexes
+        self.html = "".join(parts)
+
+    def render(self, values, allow_multiple_selected=False):
+        """Return HTML for the options, with the options that have one of the given (string) values selected."""
+        selected = [index for value in values for index in self.indexes.get(value, ())]
+        if not selected:
+            return self.html
+        if not allow_multiple_selected:
+            selected = [min(selected)]
+        parts = self.parts.copy()
+        for index in selected:
+            head, tail = self.options[index]
+            parts[index] = f"{head} selected{tail}"
+        return "".join(parts)
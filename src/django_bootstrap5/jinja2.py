@@ -53,6 +53,7 @@ class BootstrapTags(Extension):
                 f"{_PREFIX}form": forms.render_form,
                 f"{_PREFIX}form_errors": forms.render_form_errors,
                 f"{_PREFIX}formset": forms.render_formset,
+                f"{_PREFIX}formset_empty_form": forms.render_formset_empty_form,
                 f"{_PREFIX}formset_errors": forms.render_formset_errors,
                 f"{_PREFIX}javascript": tags.bootstrap_javascript,
                 f"{_PREFIX}javascript_url": core.javascript_url,
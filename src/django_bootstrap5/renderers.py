@@ -1,68 +1,256 @@
 import warnings
-
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from copy import copy
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache, partial
+from threading import Lock
+
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
 from django.forms import (
     BaseForm,
     BaseFormSet,
+    BaseModelFormSet,
     BoundField,
-    CheckboxInput,
-    CheckboxSelectMultiple,
-    ClearableFileInput,
+    ModelChoiceField,
     MultiWidget,
-    RadioSelect,
-    Select,
 )
-from django.forms.widgets import Input, SelectMultiple, Textarea
-from django.utils.html import conditional_escape, format_html, strip_tags
+from django.forms.formsets import (
+    INITIAL_FORM_COUNT,
+    MAX_NUM_FORM_COUNT,
+    MIN_NUM_FORM_COUNT,
+    TOTAL_FORM_COUNT,
+    ManagementForm,
+)
+from django.forms.renderers import DjangoTemplates as DjangoTemplatesFormRenderer
+from django.forms.renderers import TemplatesSetting
+from django.forms.widgets import Input
+from django.utils.autoreload import file_changed
+from django.utils.html import (
+    conditional_escape,
+    format_html,
+    format_html_join,
+    strip_spaces_between_tags,
+    strip_tags,
+)
 from django.utils.safestring import mark_safe
+from django.utils.timezone import get_current_timezone
+from django.utils.timezone import override as override_timezone
+from django.utils.translation import get_language, override
 
-from .core import get_bootstrap_setting
+from .choices import ChoiceCache, get_choice_cache, get_field_choice_cache
+from .core import get_bootstrap_settings, get_field_renderer, get_form_renderer
 from .css import merge_css_classes
-from .forms import render_field, render_form, render_label
+from .forms import render_form, render_label
 from .html import EMPTY_SAFE_HTML
 from .size import DEFAULT_SIZE, SIZE_MD, get_size_class, parse_size
 from .text import text_value
-from .utils import render_template_file
-from .widgets import RadioSelectButtonGroup, ReadOnlyPasswordHashWidget, is_widget_with_placeholder
+from .utils import is_default_template, render_template_file
+from .widgets import (
+    MULTI_WIDGET_CLASSES,
+    get_template_html_renderer,
+    get_widget_context,
+    get_widget_html_renderer,
+    get_widget_plan,
+)
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """
+    Resolved render options, shared by a renderer and its child renderers.
+
+    Resolving the options (with fallbacks to settings) is done once per form or formset, child renderers take the
+    options as they are and only apply their own overrides.
+    """
+
+    layout: str
+    wrapper_class: str
+    inline_wrapper_class: str
+    field_class: str
+    label_class: str
+    show_help: bool
+    show_label: bool
+    exclude: str
+    set_placeholder: bool
+    size: str
+    horizontal_label_class: str
+    horizontal_field_class: str
+    horizontal_field_offset_class: str
+    checkbox_layout: str
+    checkbox_style: str
+    inline_field_class: str
+    server_side_validation: bool
+    error_css_class: str
+    required_css_class: str
+    success_css_class: str
+    alert_error_type: str
+
+    @classmethod
+    def from_kwargs(cls, kwargs):
+        """Return options from kwargs, with fallbacks to settings and defaults."""
+        bootstrap_settings = get_bootstrap_settings()
+        return cls(
+            layout=kwargs.get("layout", bootstrap_settings.layout),
+            wrapper_class=kwargs.get("wrapper_class", bootstrap_settings.wrapper_class),
+            inline_wrapper_class=kwargs.get("inline_wrapper_class", bootstrap_settings.inline_wrapper_class),
+            field_class=kwargs.get("field_class", ""),
+            label_class=kwargs.get("label_class", bootstrap_settings.label_class),
+            show_help=kwargs.get("show_help", True),
+            show_label=kwargs.get("show_label", True),
+            exclude=kwargs.get("exclude", ""),
+            set_placeholder=kwargs.get("set_placeholder", True),
+            size=parse_size(kwargs.get("size", ""), default=SIZE_MD),
+            horizontal_label_class=kwargs.get("horizontal_label_class", bootstrap_settings.horizontal_label_class),
+            horizontal_field_class=kwargs.get("horizontal_field_class", bootstrap_settings.horizontal_field_class),
+            horizontal_field_offset_class=kwargs.get(
+                "horizontal_field_offset_class", bootstrap_settings.horizontal_field_offset_class
+            ),
+            checkbox_layout=kwargs.get("checkbox_layout", bootstrap_settings.checkbox_layout),
+            checkbox_style=kwargs.get("checkbox_style", bootstrap_settings.checkbox_style),
+            inline_field_class=kwargs.get("inline_field_class", bootstrap_settings.get("inline_field_class")),
+            server_side_validation=kwargs.get("server_side_validation", bootstrap_settings.server_side_validation),
+            error_css_class=kwargs.get("error_css_class", None),
+            required_css_class=kwargs.get("required_css_class", None),
+            success_css_class=kwargs.get("success_css_class", None),
+            alert_error_type=kwargs.get("alert_error_type", "non_fields"),
+        )
+
+    def with_overrides(self, kwargs):
+        """Return options with the values in kwargs applied, or these options if nothing changes."""
+        overrides = {
+            name: kwargs[name] for name in RENDER_OPTION_NAMES if name in kwargs and kwargs[name] != getattr(self, name)
+        }
+        if not overrides:
+            return self
+        if "size" in overrides:
+            overrides["size"] = parse_size(overrides["size"], default=SIZE_MD)
+        return replace(self, **overrides)
+
+
+RENDER_OPTION_NAMES = tuple(field.name for field in fields(RenderOptions))
+
+# Widget attributes that configure the renderer and are not rendered as HTML attributes.
+ADDON_ATTRS = frozenset(["addon_before", "addon_after", "addon_before_class", "addon_after_class"])
+
+
+def without_addon_attrs(attrs):
+    """Return copy of widget attributes without the attributes for addons."""
+    return {name: value for name, value in attrs.items() if name not in ADDON_ATTRS}
+
+
+# Rendered empty forms of formsets, by formset class, prefix, render options and language.
+EMPTY_FORMS_MAXSIZE = 128
+
+_empty_forms = OrderedDict()
+_empty_forms_lock = Lock()
+
+
+@receiver(setting_changed)
+def clear_empty_forms_on_setting_changed(**kwargs):
+    """Throw away rendered empty forms when any setting changes, settings may change how forms are rendered."""
+    with _empty_forms_lock:
+        _empty_forms.clear()
+
+
+@receiver(file_changed)
+def clear_empty_forms_on_file_changed(**kwargs):
+    """Throw away rendered empty forms when the development server sees a changed file."""
+    with _empty_forms_lock:
+        _empty_forms.clear()
+
+
+# Deprecated methods of `FieldRenderer` that change the widget attributes, still used if a subclass overrides them.
+DEPRECATED_WIDGET_ATTRS_METHODS = (
+    "add_widget_attrs",
+    "add_widget_class_attrs",
+    "add_placeholder_attrs",
+    "restore_widget_attrs",
+)
+
+
+@lru_cache(maxsize=128)
+def parse_exclude(exclude):
+    """Return set of names of excluded fields from a comma separated string."""
+    return frozenset(exclude.replace(" ", "").split(","))
+
+
+def renders_hidden_fields_as_widget(field_renderer_class):
+    """Return whether a field renderer class renders hidden fields as their widget, like `FieldRenderer.render`."""
+    return field_renderer_class.render is FieldRenderer.render
+
+
+class lazy_attribute:
+    """
+    Attribute that is computed by a method on first access and stored in a slot named after it with a leading `_`.
+
+    The attribute can be assigned like a normal attribute, for example in the `__init__` of a subclass.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.slot_name = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot_name)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot_name, value)
+            return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot_name, value)
 
 
 class BaseRenderer:
     """A content renderer."""
 
+    __slots__ = ("render_options", *RENDER_OPTION_NAMES, "choice_cache")
+
     # Template paths for overriding in custom subclasses.
     field_errors_template = "django_bootstrap5/field_errors.html"
     field_help_text_template = "django_bootstrap5/field_help_text.html"
     form_errors_template = "django_bootstrap5/form_errors.html"
 
     def __init__(self, **kwargs):
-        self.layout = kwargs.get("layout", get_bootstrap_setting("layout"))
-        self.wrapper_class = kwargs.get("wrapper_class", get_bootstrap_setting("wrapper_class"))
-        self.inline_wrapper_class = kwargs.get("inline_wrapper_class", get_bootstrap_setting("inline_wrapper_class"))
-        self.field_class = kwargs.get("field_class", "")
-        self.label_class = kwargs.get("label_class", get_bootstrap_setting("label_class"))
-        self.show_help = kwargs.get("show_help", True)
-        self.show_label = kwargs.get("show_label", True)
-        self.exclude = kwargs.get("exclude", "")
-        self.set_placeholder = kwargs.get("set_placeholder", True)
-        self.size = parse_size(kwargs.get("size", ""), default=SIZE_MD)
-        self.horizontal_label_class = kwargs.get(
-            "horizontal_label_class", get_bootstrap_setting("horizontal_label_class")
-        )
-        self.horizontal_field_class = kwargs.get(
-            "horizontal_field_class", get_bootstrap_setting("horizontal_field_class")
-        )
-        self.checkbox_layout = kwargs.get("checkbox_layout", get_bootstrap_setting("checkbox_layout"))
-        self.checkbox_style = kwargs.get("checkbox_style", get_bootstrap_setting("checkbox_style"))
-        self.horizontal_field_offset_class = kwargs.get(
-            "horizontal_field_offset_class", get_bootstrap_setting("horizontal_field_offset_class")
-        )
-        self.inline_field_class = kwargs.get("inline_field_class", get_bootstrap_setting("inline_field_class"))
-        self.server_side_validation = kwargs.get(
-            "server_side_validation", get_bootstrap_setting("server_side_validation")
-        )
-        self.error_css_class = kwargs.get("error_css_class", None)
-        self.required_css_class = kwargs.get("required_css_class", None)
-        self.success_css_class = kwargs.get("success_css_class", None)
-        self.alert_error_type = kwargs.get("alert_error_type", "non_fields")
+        render_options = kwargs.get("render_options")
+        if render_options is None:
+            render_options = RenderOptions.from_kwargs(kwargs)
+        else:
+            render_options = render_options.with_overrides(kwargs)
+        self.render_options = render_options
+        self.layout = render_options.layout
+        self.wrapper_class = render_options.wrapper_class
+        self.inline_wrapper_class = render_options.inline_wrapper_class
+        self.field_class = render_options.field_class
+        self.label_class = render_options.label_class
+        self.show_help = render_options.show_help
+        self.show_label = render_options.show_label
+        self.exclude = render_options.exclude
+        self.set_placeholder = render_options.set_placeholder
+        self.size = render_options.size
+        self.horizontal_label_class = render_options.horizontal_label_class
+        self.horizontal_field_class = render_options.horizontal_field_class
+        self.checkbox_layout = render_options.checkbox_layout
+        self.checkbox_style = render_options.checkbox_style
+        self.horizontal_field_offset_class = render_options.horizontal_field_offset_class
+        self.inline_field_class = render_options.inline_field_class
+        self.server_side_validation = render_options.server_side_validation
+        self.error_css_class = render_options.error_css_class
+        self.required_css_class = render_options.required_css_class
+        self.success_css_class = render_options.success_css_class
+        self.alert_error_type = render_options.alert_error_type
+        self.choice_cache = get_choice_cache(kwargs)
 
     @property
     def is_floating(self):
@@ -86,8 +274,10 @@ class BaseRenderer:
     def get_kwargs(self):
         """Return kwargs to pass on to child renderers."""
         context = {
+            "render_options": self.render_options,
             "layout": self.layout,
             "wrapper_class": self.wrapper_class,
+            "inline_wrapper_class": self.inline_wrapper_class,
             "field_class": self.field_class,
             "label_class": self.label_class,
             "show_help": self.show_help,
@@ -106,9 +296,29 @@ class BaseRenderer:
             "success_css_class": self.success_css_class,
             "required_css_class": self.required_css_class,
             "alert_error_type": self.alert_error_type,
+            "choice_cache": self.choice_cache,
         }
         return context
 
+    def prefetch_choices(self, fields):
+        """Evaluate the choices of the model choice fields in the choice cache, so rendering does not query them."""
+        for field in fields:
+            choice_cache = get_field_choice_cache(field, self.choice_cache)
+            if choice_cache is not None:
+                choice_cache.get_widget(field.widget)
+
+    def prefetch(self):
+        """Do the blocking work of the render, like validation and database queries, before rendering."""
+
+    def get_form_errors_html(self, errors, context):
+        """Return HTML for form errors, the template is only used if it is overridden."""
+        if is_default_template(self.form_errors_template):
+            return format_html(
+                '<ul class="list-unstyled text-danger">\n    {}\n</ul>\n\n',
+                format_html_join("", "\n        <li>{}</li>\n    ", ((error,) for error in errors)),
+            )
+        return render_template_file(self.form_errors_template, context={"errors": errors, **context})
+
     def render(self):
         """Render to string."""
         return EMPTY_SAFE_HTML
@@ -117,22 +327,172 @@ class BaseRenderer:
 class FormsetRenderer(BaseRenderer):
     """Default formset renderer."""
 
+    __slots__ = ("formset", "max_workers", "parallel", "stamped", "cache_empty_form", "start", "stop", "_window_forms")
+
     def __init__(self, formset, **kwargs):
         if not isinstance(formset, BaseFormSet):
             raise TypeError('Parameter "formset" should contain a valid Django Formset.')
         self.formset = formset
+        self.max_workers = kwargs.get("max_workers", None)
+        self.parallel = kwargs.get("parallel", self.max_workers is not None)
+        self.stamped = kwargs.get("stamped", False)
+        self.cache_empty_form = kwargs.get("cache_empty_form", False)
+        self.start = kwargs.get("start", 0)
+        self.stop = kwargs.get("stop", None)
+        self._window_forms = None
         super().__init__(**kwargs)
 
+    @property
+    def is_windowed(self):
+        """Return whether only a window of the forms of the formset is rendered."""
+        return (self.start, self.stop) != (0, None) and not self.formset.is_bound
+
+    def get_window(self):
+        """Return start and stop index of the forms to render, within the number of forms of the formset."""
+        total_form_count = self.formset.total_form_count()
+        if not self.is_windowed:
+            return 0, total_form_count
+        start = min(self.start, total_form_count)
+        stop = total_form_count if self.stop is None else max(start, min(self.stop, total_form_count))
+        return start, stop
+
+    def get_window_management_data(self):
+        """Return total and initial form count for a management form that covers the forms up to the window end."""
+        _start, stop = self.get_window()
+        return {
+            TOTAL_FORM_COUNT: stop,
+            INITIAL_FORM_COUNT: min(self.formset.initial_form_count(), stop),
+        }
+
+    def get_forms(self):
+        """Return the forms to render."""
+        formset = self.formset
+        if not self.is_windowed or "forms" in formset.__dict__:
+            start, stop = self.get_window()
+            return formset.forms[start:stop]
+        if self._window_forms is None:
+            start, stop = self.get_window()
+            if hasattr(formset, "_construct_form"):
+                # `BaseFormSet.forms` constructs every form with this (private) method, constructing only the forms in
+                # the window is what keeps windowed renders of large formsets cheap
+                self._window_forms = [
+                    formset._construct_form(i, **formset.get_form_kwargs(i)) for i in range(start, stop)
+                ]
+            else:
+                self._window_forms = formset.forms[start:stop]
+        return self._window_forms
+
+    def prefetch(self):
+        """Validate a bound formset and evaluate the choices of the model choice fields of the forms to render."""
+        self.formset.is_valid()
+        for form in self.get_forms():
+            self.prefetch_choices(form.fields.values())
+
     def render_management_form(self):
         """Return HTML for management form."""
-        return text_value(self.formset.management_form)
+        formset = self.formset
+        if self.is_windowed:
+            if self.start:
+                # The submitted forms have to match the management form, which counts the forms from index 0
+                raise ValueError(
+                    'Parameter "start" is only allowed when rendering the forms of a formset, '
+                    "the management form counts the forms from 0."
+                )
+            management_form = ManagementForm(
+                auto_id=formset.auto_id,
+                prefix=formset.prefix,
+                initial={
+                    **self.get_window_management_data(),
+                    MIN_NUM_FORM_COUNT: formset.min_num,
+                    MAX_NUM_FORM_COUNT: formset.max_num,
+                },
+                renderer=formset.renderer,
+            )
+            return text_value(management_form)
+        return text_value(formset.management_form)
+
+    def get_form_html_function(self, kwargs):
+        """Return function that returns HTML for a form of the formset."""
+        if self.stamped:
+            return FormStamper(kwargs).render_form
+        return partial(render_form, **kwargs)
+
+    def iter_render_forms(self):
+        """Yield HTML for each form, in order."""
+        if self.parallel:
+            yield from self.iter_render_forms_parallel()
+        else:
+            render = self.get_form_html_function(self.get_kwargs())
+            for form in self.get_forms():
+                yield render(form)
+
+    def iter_render_forms_parallel(self):
+        """Yield HTML for each form in order, rendering the forms concurrently in a thread pool."""
+        # Query in this thread, the worker threads have their own connections outside of the caller's transaction
+        if self.choice_cache is None:
+            self.choice_cache = ChoiceCache()
+        self.prefetch()
+        render = self.get_form_html_function(self.get_kwargs())
+        # Each task runs in its own copy of the caller's context. Django keeps the active language and time zone in
+        # asgiref locals, which are not visible from another thread through a copied context, so activate them again.
+        context = copy_context()
+        language = get_language()
+        current_timezone = get_current_timezone()
+
+        def render_form(form):
+            with override(language), override_timezone(current_timezone):
+                return render(form)
+
+        def render_form_in_thread(form):
+            try:
+                return context.copy().run(render_form, form)
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(render_form_in_thread, self.get_forms())
 
     def render_forms(self):
-        rendered_forms = EMPTY_SAFE_HTML
-        kwargs = self.get_kwargs()
-        for form in self.formset.forms:
-            rendered_forms += render_form(form, **kwargs)
-        return rendered_forms
+        return mark_safe("".join(self.iter_render_forms()))
+
+    def get_empty_form_key(self):
+        """Return key of the rendered empty form in the process-level cache, or None if it is not cached."""
+        if not self.cache_empty_form:
+            return None
+        formset = self.formset
+        if formset.get_form_kwargs(None):
+            # The empty form may depend on the request, for example the current user
+            return None
+        if isinstance(formset, BaseModelFormSet) or type(formset).add_fields is not BaseFormSet.add_fields:
+            # Model and inline formsets, and formsets that add their own fields, may add fields that depend on the
+            # formset instance, like the foreign key to the parent instance of an inline formset
+            return None
+        if any(isinstance(field, ModelChoiceField) for field in formset.form.base_fields.values()):
+            # Model choices change when the database changes
+            return None
+        key = (self.__class__, formset.__class__, formset.prefix, formset.auto_id, self.render_options, get_language())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def render_empty_form(self):
+        """Return HTML for the empty form of the formset, with `__prefix__` in place of the form index."""
+        key = self.get_empty_form_key()
+        if key is not None:
+            with _empty_forms_lock:
+                html = _empty_forms.get(key)
+                if html is not None:
+                    _empty_forms.move_to_end(key)
+                    return html
+        html = render_form(self.formset.empty_form, **self.get_kwargs())
+        if key is not None:
+            with _empty_forms_lock:
+                _empty_forms[key] = html
+                while len(_empty_forms) > EMPTY_FORMS_MAXSIZE:
+                    _empty_forms.popitem(last=False)
+        return html
 
     def get_formset_errors(self):
         return self.formset.non_form_errors()
@@ -140,35 +500,54 @@ class FormsetRenderer(BaseRenderer):
     def render_errors(self):
         formset_errors = self.get_formset_errors()
         if formset_errors:
-            return render_template_file(
-                self.form_errors_template,
-                context={
-                    "errors": formset_errors,
-                    "form": self.formset,
-                    "layout": self.layout,
-                },
-            )
+            return self.get_form_errors_html(formset_errors, context={"form": self.formset, "layout": self.layout})
         return EMPTY_SAFE_HTML
 
+    def iter_render(self):
+        """Yield HTML for management form, errors and each form, so large formsets can be streamed."""
+        yield mark_safe(self.render_management_form())
+        errors = self.render_errors()
+        if errors:
+            yield errors
+        yield from self.iter_render_forms()
+
     def render(self):
-        return format_html(self.render_management_form() + "{}{}", self.render_errors(), self.render_forms())
+        return mark_safe("".join(self.iter_render()))
 
 
 class FormRenderer(BaseRenderer):
     """Default form renderer."""
 
+    __slots__ = ("form",)
+
     def __init__(self, form, **kwargs):
         if not isinstance(form, BaseForm):
             raise TypeError('Parameter "form" should contain a valid Django Form.')
         self.form = form
         super().__init__(**kwargs)
 
-    def render_fields(self):
-        rendered_fields = EMPTY_SAFE_HTML
+    def prefetch(self):
+        """Validate a bound form and evaluate the choices of its model choice fields."""
+        self.form.is_valid()
+        self.prefetch_choices(self.form.fields.values())
+
+    def iter_render_fields(self):
+        """Yield HTML for each field, in order."""
         kwargs = self.get_kwargs()
+        field_renderer_class = get_field_renderer(**kwargs)
+        exclude = parse_exclude(self.exclude)
+        hidden_as_widget = renders_hidden_fields_as_widget(field_renderer_class)
         for field in self.form:
-            rendered_fields += render_field(field, **kwargs)
-        return rendered_fields
+            # Excluded and hidden fields do not need a field renderer
+            if field.name in exclude:
+                continue
+            if hidden_as_widget and field.is_hidden:
+                yield text_value(field)
+            else:
+                yield field_renderer_class(field, **kwargs).render()
+
+    def render_fields(self):
+        return mark_safe("".join(self.iter_render_fields()))
 
     def get_fields_errors(self):
         form_errors = []
@@ -187,77 +566,160 @@ class FormRenderer(BaseRenderer):
             form_errors = self.form.non_field_errors()
 
         if form_errors:
-            return render_template_file(
-                self.form_errors_template,
-                context={"errors": form_errors, "form": self.form, "layout": self.layout, "type": type},
+            return self.get_form_errors_html(
+                form_errors, context={"form": self.form, "layout": self.layout, "type": type}
             )
 
         return EMPTY_SAFE_HTML
 
+    def iter_render(self):
+        """Yield HTML for errors and each field, so large forms can be streamed."""
+        errors = self.render_errors(self.alert_error_type)
+        if errors:
+            yield errors
+        yield from self.iter_render_fields()
+
     def render(self):
         errors = self.render_errors(self.alert_error_type)
         fields = self.render_fields()
         return errors + fields
 
 
+def render_bound_widget(field, widget, attrs, html_renderer):
+    """Return HTML for a widget of a bound field, in Python if there is an HTML renderer, like `as_widget`."""
+    if html_renderer is None:
+        return field.as_widget(widget=widget, attrs=attrs)
+    if field.field.localize:
+        widget.is_localized = True
+    attrs = field.build_widget_attrs(attrs or {}, widget)
+    if field.auto_id and "id" not in widget.attrs:
+        attrs.setdefault("id", field.auto_id)
+    return html_renderer(get_widget_context(widget, field.html_name, field.value(), attrs))
+
+
 class FieldRenderer(BaseRenderer):
     """Default field renderer."""
 
+    __slots__ = (
+        "field",
+        "kwargs",
+        "widget",
+        "is_multi_widget",
+        "label",
+        "input_class",
+        "_help_text",
+        "_field_errors",
+        "_placeholder",
+        "_addon_before",
+        "_addon_after",
+        "_addon_before_class",
+        "_addon_after_class",
+        "_initial_attrs",
+    )
+
+    # Whether a subclass overrides the deprecated methods that change the attributes of the widget.
+    uses_deprecated_widget_attrs_methods = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        overridden = [
+            name for name in DEPRECATED_WIDGET_ATTRS_METHODS if getattr(cls, name) is not getattr(FieldRenderer, name)
+        ]
+        cls.uses_deprecated_widget_attrs_methods = bool(overridden)
+        if overridden and "get_field_html" not in cls.__dict__:
+            warnings.warn(
+                f"{cls.__name__} overrides {', '.join(overridden)}, these methods are deprecated. "
+                "Override get_widget_attrs() or get_widget_template_name() instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
     def __init__(self, field, **kwargs):
         if not isinstance(field, BoundField):
             raise TypeError('Parameter "field" should contain a valid Django BoundField.')
         self.field = field
         super().__init__(**kwargs)
+        self.kwargs = kwargs
 
         self.widget = field.field.widget
         self.is_multi_widget = isinstance(field.field.widget, MultiWidget)
-        self.initial_attrs = self.widget.attrs.copy()
-        self.help_text = text_value(field.help_text) if self.show_help and field.help_text else ""
-        self.field_errors = [conditional_escape(text_value(error)) for error in field.errors]
         self.label = kwargs.get("label", field.label)
 
-        self.placeholder = text_value(kwargs.get("placeholder", self.default_placeholder))
-
-        self.addon_before = kwargs.get("addon_before", self.widget.attrs.pop("addon_before", ""))
-        self.addon_after = kwargs.get("addon_after", self.widget.attrs.pop("addon_after", ""))
         if self.layout == "floating" and (self.addon_before or self.addon_after):
             warnings.warn(
                 'layout="floating" has no effect when addon_before or addon_after is set.',
                 stacklevel=2,
             )
-        self.addon_before_class = kwargs.get(
-            "addon_before_class", self.widget.attrs.pop("addon_before_class", "input-group-text")
-        )
-        self.addon_after_class = kwargs.get(
-            "addon_after_class", self.widget.attrs.pop("addon_after_class", "input-group-text")
-        )
 
         # These are set in Django or in the global BOOTSTRAP5 settings, and can be overwritten in the template
-        error_css_class = kwargs.get("error_css_class", None)
+        bootstrap_settings = get_bootstrap_settings()
+        error_css_class = self.error_css_class
         self.error_css_class = (
-            getattr(field.form, "error_css_class", get_bootstrap_setting("error_css_class"))
+            getattr(field.form, "error_css_class", bootstrap_settings.error_css_class)
             if error_css_class is None
             else error_css_class
         )
 
-        required_css_class = kwargs.get("required_css_class", None)
+        required_css_class = self.required_css_class
         self.required_css_class = (
-            getattr(field.form, "required_css_class", get_bootstrap_setting("required_css_class"))
+            getattr(field.form, "required_css_class", bootstrap_settings.required_css_class)
             if required_css_class is None
             else required_css_class
         )
         if self.field.form.empty_permitted:
             self.required_css_class = ""
 
-        success_css_class = kwargs.get("success_css_class", None)
+        success_css_class = self.success_css_class
         self.success_css_class = (
-            getattr(field.form, "success_css_class", get_bootstrap_setting("success_css_class"))
+            getattr(field.form, "success_css_class", bootstrap_settings.success_css_class)
             if success_css_class is None
             else success_css_class
         )
 
         self.input_class = kwargs.get("input_class", "")
 
+    @lazy_attribute
+    def help_text(self):
+        """Return help text of the field, or an empty string if help is not shown."""
+        field = self.field
+        return text_value(field.help_text) if self.show_help and field.help_text else ""
+
+    @lazy_attribute
+    def field_errors(self):
+        """Return escaped errors of the field."""
+        return [conditional_escape(text_value(error)) for error in self.field.errors]
+
+    @lazy_attribute
+    def placeholder(self):
+        """Return placeholder for the field."""
+        return text_value(self.kwargs.get("placeholder", self.default_placeholder))
+
+    @lazy_attribute
+    def addon_before(self):
+        """Return content of the addon before the widget."""
+        return self.kwargs.get("addon_before", self.widget.attrs.get("addon_before", ""))
+
+    @lazy_attribute
+    def addon_after(self):
+        """Return content of the addon after the widget."""
+        return self.kwargs.get("addon_after", self.widget.attrs.get("addon_after", ""))
+
+    @lazy_attribute
+    def addon_before_class(self):
+        """Return CSS class of the addon before the widget."""
+        return self.kwargs.get("addon_before_class", self.widget.attrs.get("addon_before_class", "input-group-text"))
+
+    @lazy_attribute
+    def addon_after_class(self):
+        """Return CSS class of the addon after the widget."""
+        return self.kwargs.get("addon_after_class", self.widget.attrs.get("addon_after_class", "input-group-text"))
+
+    def prefetch(self):
+        """Validate a bound form and evaluate the choices of the field if it is a model choice field."""
+        # `field_errors` is lazy, so the form is no longer validated when the renderer is constructed
+        self.field.form.is_valid()
+        self.prefetch_choices([self.field.field])
+
     @property
     def is_floating(self):
         return (
@@ -270,115 +732,159 @@ class FieldRenderer(BaseRenderer):
     @property
     def default_placeholder(self):
         """Return default placeholder for field."""
-        return self.label if get_bootstrap_setting("set_placeholder") else ""
-
-    def restore_widget_attrs(self):
-        self.widget.attrs = self.initial_attrs.copy()
+        return self.label if get_bootstrap_settings().set_placeholder else ""
 
     def get_widget_input_type(self, widget):
         """Return input type of widget, or None."""
         return widget.input_type if isinstance(widget, Input) else None
 
+    def get_widget_plan(self, widget=None):
+        """Return `WidgetPlan` that describes how to render widget."""
+        return get_widget_plan(widget or self.widget)
+
     def is_form_control_widget(self, widget=None):
-        widget = widget or self.widget
-        if isinstance(widget, Input):
-            return self.get_widget_input_type(widget) in [
-                "text",
-                "number",
-                "email",
-                "url",
-                "tel",
-                "date",
-                "time",
-                "password",
-                "month",
-                "datetime-local",
-            ]
-
-        return isinstance(widget, Textarea)
+        return self.get_widget_plan(widget).is_form_control
 
     def can_widget_have_server_side_validation(self, widget):
         """Return whether given widget can be rendered with server-side validation classes."""
-        return self.get_widget_input_type(widget) != "color"
+        return self.get_widget_plan(widget).can_have_server_side_validation
 
     def can_widget_float(self, widget):
         """Return whether given widget can be set to `form-floating` behavior."""
         if self.is_form_control_widget(widget):
             return True
-        if isinstance(widget, Select):
-            return self.size == DEFAULT_SIZE and not isinstance(widget, (SelectMultiple, RadioSelect))
-        return False
+        # Widgets that are not form controls, such as single selects
+        plan = self.get_widget_plan(widget)
+        return (
+            plan.can_float
+            and not plan.is_form_control
+            and (self.size == DEFAULT_SIZE or not plan.float_requires_default_size)
+        )
 
     def can_widget_have_addons(self, widget=None):
         """Return whether given widget can be rendered with addon_before/addon_after."""
-        widget = widget or self.widget
         if self.is_form_control_widget(widget):
             return True
-        return isinstance(widget, Select) and not isinstance(widget, (SelectMultiple, RadioSelect))
+        plan = self.get_widget_plan(widget)
+        return plan.can_have_addons and not plan.is_form_control
 
-    def add_widget_class_attrs(self, widget=None):
-        """Add class attribute to widget."""
+    def get_widget_class(self, widget=None):
+        """Return CSS class for widget."""
         if widget is None:
             widget = self.widget
-        size_prefix = None
-
-        before = []
-        classes = [widget.attrs.get("class", ""), text_value(self.field_class), text_value(self.input_class)]
-
-        if ReadOnlyPasswordHashWidget is not None and isinstance(widget, ReadOnlyPasswordHashWidget):
-            before.append("form-control-plaintext")
-        elif isinstance(widget, Select):
-            before.append("form-select")
-            size_prefix = "form-select"
-        elif isinstance(widget, CheckboxInput):
-            before.append("form-check-input")
-        elif isinstance(widget, (Input, Textarea)):
-            input_type = self.get_widget_input_type(widget)
-            if input_type == "range":
-                before.append("form-range")
-            else:
-                before.append("form-control")
-                if input_type == "color":
-                    before.append("form-control-color")
-                size_prefix = "form-control"
-
-        if size_prefix:
-            classes.append(get_size_class(self.size, prefix=size_prefix, skip=["xs", "md"]))
-
+        plan = self.get_widget_plan(widget)
+        classes = [*plan.base_classes, widget.attrs.get("class", ""), text_value(self.field_class)]
+        classes.append(text_value(self.input_class))
+        if plan.size_prefix and self.size != DEFAULT_SIZE:
+            classes.append(f"{plan.size_prefix}-{self.size}")
         if self.server_side_validation and self.can_widget_have_server_side_validation(widget):
             classes.append(self.get_server_side_validation_classes())
+        return merge_css_classes(*classes)
 
-        classes = before + classes
-        widget.attrs["class"] = merge_css_classes(*classes)
+    def get_widget_placeholder(self, widget=None):
+        """Return placeholder for widget, or None if widget should not have a placeholder."""
+        if widget is None:
+            widget = self.widget
+        placeholder = widget.attrs.get("placeholder", self.placeholder)
+        if placeholder and self.set_placeholder and self.get_widget_plan(widget).can_have_placeholder:
+            return conditional_escape(strip_tags(placeholder))
+        return None
+
+    def get_widget_attrs(self, widget=None):
+        """Return HTML attributes for widget as a new dict, the attributes of the widget are not changed."""
+        if widget is None:
+            widget = self.widget
+        attrs = without_addon_attrs(widget.attrs)
+        attrs["class"] = self.get_widget_class(widget)
 
         # Add button size class for RadioSelectButtonGroup
-        if isinstance(widget, RadioSelectButtonGroup):
-            btn_size_class = get_size_class(self.size, prefix="btn", skip=["xs", "md"])
-            widget.attrs["btn_size_class"] = btn_size_class
+        if self.get_widget_plan(widget).has_button_size_class:
+            attrs["btn_size_class"] = get_size_class(self.size, prefix="btn", skip=["xs", "md"])
+
+        placeholder = self.get_widget_placeholder(widget)
+        if placeholder:
+            attrs["placeholder"] = placeholder
+        return attrs
+
+    def get_widget_template_name(self, widget=None):
+        """Return name of template to render widget with."""
+        if widget is None:
+            widget = self.widget
+        return self.get_widget_plan(widget).template_name or widget.template_name
+
+    @lazy_attribute
+    def initial_attrs(self):
+        """Return copy of the attributes of the widget, for the deprecated `restore_widget_attrs`."""
+        return self.widget.attrs.copy()
+
+    def restore_widget_attrs(self):
+        """Restore the attributes of the widget, deprecated."""
+        warnings.warn("restore_widget_attrs() is deprecated.", DeprecationWarning, stacklevel=2)
+        self.widget.attrs = self.initial_attrs.copy()
+
+    def add_widget_class_attrs(self, widget=None):
+        """Add class attribute to widget, deprecated in favor of `get_widget_class()`."""
+        warnings.warn(
+            "add_widget_class_attrs() is deprecated, use get_widget_class().", DeprecationWarning, stacklevel=2
+        )
+        # Take the attributes to restore before they change
+        self.initial_attrs  # noqa: B018
+        if widget is None:
+            widget = self.widget
+        widget.attrs["class"] = self.get_widget_class(widget)
+        if self.get_widget_plan(widget).has_button_size_class:
+            widget.attrs["btn_size_class"] = get_size_class(self.size, prefix="btn", skip=["xs", "md"])
 
     def add_placeholder_attrs(self, widget=None):
-        """Add placeholder attribute to widget."""
+        """Add placeholder attribute to widget, deprecated in favor of `get_widget_placeholder()`."""
+        warnings.warn(
+            "add_placeholder_attrs() is deprecated, use get_widget_placeholder().", DeprecationWarning, stacklevel=2
+        )
+        # Take the attributes to restore before they change
+        self.initial_attrs  # noqa: B018
         if widget is None:
             widget = self.widget
-        placeholder = widget.attrs.get("placeholder", self.placeholder)
-        if placeholder and self.set_placeholder and is_widget_with_placeholder(widget):
-            widget.attrs["placeholder"] = conditional_escape(strip_tags(placeholder))
+        placeholder = self.get_widget_placeholder(widget)
+        if placeholder:
+            widget.attrs["placeholder"] = placeholder
 
     def add_widget_attrs(self):
-        """Return HTML attributes for widget as dict."""
-        if self.is_multi_widget:
-            widgets = self.widget.widgets
-        else:
-            widgets = [self.widget]
+        """Add attributes and template name to widget, deprecated in favor of `get_widget_attrs()`."""
+        warnings.warn("add_widget_attrs() is deprecated, use get_widget_attrs().", DeprecationWarning, stacklevel=2)
+        self.initial_attrs  # noqa: B018
+        widgets = self.widget.widgets if self.is_multi_widget else [self.widget]
         for widget in widgets:
             self.add_widget_class_attrs(widget)
             self.add_placeholder_attrs(widget)
-            if isinstance(widget, (RadioSelect, CheckboxSelectMultiple)) and not isinstance(
-                widget, RadioSelectButtonGroup
-            ):
-                widget.template_name = "django_bootstrap5/widgets/radio_select.html"
-            elif isinstance(widget, ClearableFileInput):
-                widget.template_name = "django_bootstrap5/widgets/clearable_file_input.html"
+            widget.template_name = self.get_widget_template_name(widget)
+
+    def get_deprecated_field_html(self):
+        """Return HTML for field with the deprecated methods that change the widget, applied to a copy of the widget."""
+        widget = self.widget
+        widget_copy = copy(widget)
+        widget_copy.attrs = without_addon_attrs(widget.attrs)
+        if self.is_multi_widget:
+            widget_copy.widgets = [copy(subwidget) for subwidget in widget.widgets]
+            for subwidget in widget_copy.widgets:
+                subwidget.attrs = without_addon_attrs(subwidget.attrs)
+        self.widget = widget_copy
+        try:
+            self.initial_attrs = widget_copy.attrs.copy()
+            self.add_widget_attrs()
+            html = self.render_widget(self.widget, attrs=self.widget.attrs)
+            self.restore_widget_attrs()
+            return html
+        finally:
+            self.widget = widget
+
+    def get_widget_for_render(self, widget=None):
+        """Return shallow copy of widget with attributes and template name for rendering."""
+        if widget is None:
+            widget = self.widget
+        widget_for_render = copy(widget)
+        widget_for_render.attrs = self.get_widget_attrs(widget)
+        widget_for_render.template_name = self.get_widget_template_name(widget)
+        return widget_for_render
 
     def get_label_class(self, horizontal=False):
         """Return CSS class for label."""
@@ -386,7 +892,7 @@ class FieldRenderer(BaseRenderer):
         if not self.show_label:
             label_classes.append("visually-hidden")
         else:
-            if isinstance(self.widget, CheckboxInput):
+            if self.get_widget_plan().is_checkbox:
                 widget_label_class = "form-check-label"
             elif self.is_inline:
                 widget_label_class = "visually-hidden"
@@ -397,12 +903,97 @@ class FieldRenderer(BaseRenderer):
             label_classes = [widget_label_class] + label_classes
         return merge_css_classes(*label_classes)
 
+    def get_widget_html_renderer(self, widget):
+        """Return function that renders widget in Python, or None if the widget is rendered with its template."""
+        form_renderer_class = self.field.form.renderer.__class__
+        html_renderer = get_template_html_renderer(widget.template_name)
+        if html_renderer is not None:
+            # The whitespace of the Django templates is replicated, other template engines render it differently
+            if form_renderer_class in (DjangoTemplatesFormRenderer, TemplatesSetting) and is_default_template(
+                widget.template_name
+            ):
+                return html_renderer
+            return None
+        if not get_bootstrap_settings().python_widget_rendering:
+            return None
+        if form_renderer_class is not DjangoTemplatesFormRenderer:
+            # Only this form renderer guarantees the Django widget templates that are replicated
+            return None
+        return get_widget_html_renderer(widget)
+
+    def render_widget(self, widget, attrs=None):
+        """Return HTML for widget of field, like `BoundField.as_widget`."""
+        choice_cache = get_field_choice_cache(self.field.field, self.choice_cache)
+        if choice_cache is not None:
+            widget = choice_cache.get_widget(widget)
+        return render_bound_widget(self.field, widget, attrs, self.get_widget_html_renderer(widget))
+
+    def get_multi_widget_html_renderers(self, widget):
+        """Return functions that render the subwidgets of a multi widget in Python, or None to use templates."""
+        widget_class = widget.__class__
+        if widget_class not in MULTI_WIDGET_CLASSES or widget.template_name != widget_class.template_name:
+            return None
+        if "type" in widget.attrs:
+            # MultiWidget passes this on to the input type of its subwidgets
+            return None
+        html_renderers = []
+        for subwidget in widget.widgets:
+            if self.get_widget_template_name(subwidget) != subwidget.template_name:
+                return None
+            if not ADDON_ATTRS.isdisjoint(subwidget.attrs):
+                return None
+            html_renderer = self.get_widget_html_renderer(subwidget)
+            if html_renderer is None:
+                return None
+            html_renderers.append(html_renderer)
+        return html_renderers
+
+    def get_multi_widget_html(self):
+        """Return HTML for a field with a multi widget, like `MultiWidget.get_context` and `multiwidget.html`."""
+        widget = self.widget
+        html_renderers = self.get_multi_widget_html_renderers(widget)
+        if html_renderers is None:
+            widget = copy(widget)
+            widget.attrs = without_addon_attrs(widget.attrs)
+            widget.widgets = [self.get_widget_for_render(subwidget) for subwidget in widget.widgets]
+            return self.render_widget(widget)
+
+        field = self.field
+        if field.field.localize:
+            widget.is_localized = True
+        attrs = field.build_widget_attrs({}, widget)
+        if field.auto_id and "id" not in widget.attrs:
+            attrs.setdefault("id", field.auto_id)
+        attrs = widget.build_attrs(without_addon_attrs(widget.attrs), attrs)
+        id_ = attrs.get("id")
+        value = field.value()
+        if not isinstance(value, (list, tuple)):
+            value = widget.decompress(value)
+
+        html = []
+        for index, (subwidget, widget_name, html_renderer) in enumerate(
+            zip(widget.widgets, widget.widgets_names, html_renderers)
+        ):
+            if widget.is_localized:
+                subwidget.is_localized = True
+            subwidget_attrs = {**self.get_widget_attrs(subwidget), **attrs}
+            if id_:
+                subwidget_attrs["id"] = f"{id_}_{index}"
+            subwidget_value = value[index] if index < len(value) else None
+            context = get_widget_context(subwidget, field.html_name + widget_name, subwidget_value, subwidget_attrs)
+            html.append(html_renderer(context))
+        return mark_safe(strip_spaces_between_tags("".join(html).strip()))
+
     def get_field_html(self):
-        """Return HTML for field."""
-        self.add_widget_attrs()
-        field_html = self.field.as_widget(attrs=self.widget.attrs)
-        self.restore_widget_attrs()
-        return field_html
+        """Return HTML for field, without changing the widget of the field."""
+        widget = self.widget
+        if self.uses_deprecated_widget_attrs_methods:
+            return self.get_deprecated_field_html()
+        if self.is_multi_widget:
+            return self.get_multi_widget_html()
+        if widget.template_name != self.get_widget_template_name(widget) or not ADDON_ATTRS.isdisjoint(widget.attrs):
+            return self.render_widget(self.get_widget_for_render(widget))
+        return self.render_widget(widget, attrs=self.get_widget_attrs(widget))
 
     def get_label_html(self, horizontal=False):
         """Return value for label."""
@@ -420,12 +1011,15 @@ class FieldRenderer(BaseRenderer):
         """Return HTML for help text."""
         help_text = self.help_text or ""
         if help_text:
+            id_help_text = f"{self.field.auto_id}_helptext"
+            if is_default_template(self.field_help_text_template):
+                return format_html('<div id="{}" class="form-text">{}</div>\n', id_help_text, mark_safe(help_text))
             return render_template_file(
                 self.field_help_text_template,
                 context={
                     "field": self.field,
                     "help_text": help_text,
-                    "id_help_text": f"{self.field.auto_id}_helptext",
+                    "id_help_text": id_help_text,
                     "layout": self.layout,
                     "show_help": self.show_help,
                 },
@@ -436,6 +1030,16 @@ class FieldRenderer(BaseRenderer):
         """Return HTML for field errors."""
         field_errors = self.field_errors
         if field_errors:
+            if is_default_template(self.field_errors_template):
+                return format_html(
+                    '\n    <div id="{}_error" class="w-100">\n        {}\n    </div>\n\n',
+                    self.field.auto_id,
+                    format_html_join(
+                        "",
+                        '\n            <div class="invalid-feedback d-block">{}</div>\n        ',
+                        ((error,) for error in field_errors),
+                    ),
+                )
             return render_template_file(
                 self.field_errors_template,
                 context={
@@ -496,10 +1100,10 @@ class FieldRenderer(BaseRenderer):
 
     def field_before_label(self):
         """Return whether field should be placed before label."""
-        return isinstance(self.widget, CheckboxInput) or self.is_floating
+        return self.get_widget_plan().is_checkbox or self.is_floating
 
     def render(self):
-        if self.field.name in self.exclude.replace(" ", "").split(","):
+        if self.field.name in parse_exclude(self.exclude):
             return EMPTY_SAFE_HTML
         if self.field.is_hidden:
             return text_value(self.field)
@@ -543,7 +1147,7 @@ class FieldRenderer(BaseRenderer):
                 field = format_html('<div class="{}">{}{}{}{}</div>', classes, addon_before, field, addon_after, errors)
                 errors = ""
 
-        if isinstance(self.widget, CheckboxInput):
+        if self.get_widget_plan().is_checkbox:
             field = format_html('<div class="{}">{}{}{}</div>', self.get_checkbox_classes(), field, errors, help)
             errors = ""
             help = ""
@@ -561,3 +1165,202 @@ class FieldRenderer(BaseRenderer):
             label=label,
             field_with_errors_and_help=field_with_errors_and_help,
         )
+
+
+# Prefix of the form that stamps are rendered with, and placeholder for the HTML of the widget in a stamp.
+STAMP_PREFIX = "__bootstrap5_stamp__"
+STAMP_FIELD_HTML = mark_safe("\x00field_html\x00")
+
+# Methods of `FormRenderer` that a form renderer must not override to have its forms stamped.
+STAMPED_FORM_RENDERER_METHODS = ("render", "render_errors", "render_fields", "iter_render_fields")
+
+# Methods of `FieldRenderer` that build the markup around the widget and the attributes of the widget, a field renderer
+# must not override these to have its fields stamped, because the markup of the first form would be copied into all
+# forms.
+STAMPED_FIELD_RENDERER_METHODS = (
+    "__init__",
+    "render",
+    "field_before_label",
+    "get_wrapper_classes",
+    "get_inline_field_class",
+    "get_label_html",
+    "get_label_class",
+    "get_help_html",
+    "get_errors_html",
+    "get_server_side_validation_classes",
+    "get_checkbox_classes",
+    "get_field_html",
+    "render_widget",
+    "get_widget_attrs",
+    "get_widget_class",
+    "get_widget_placeholder",
+    "get_widget_template_name",
+    "get_widget_for_render",
+    "get_widget_html_renderer",
+)
+
+_stamp_field_renderer_classes = {}
+
+
+def get_stamp_field_renderer_class(field_renderer_class):
+    """Return subclass of a field renderer class that renders a placeholder instead of the widget."""
+    try:
+        return _stamp_field_renderer_classes[field_renderer_class]
+    except KeyError:
+        pass
+
+    def get_field_html(self):
+        return STAMP_FIELD_HTML
+
+    stamp_class = type(
+        f"Stamp{field_renderer_class.__name__}",
+        (field_renderer_class,),
+        {"__slots__": (), "get_field_html": get_field_html},
+    )
+    _stamp_field_renderer_classes[field_renderer_class] = stamp_class
+    return stamp_class
+
+
+@dataclass(frozen=True)
+class FieldStamp:
+    """Markup around the widget of a field split on the prefix, and how the field renderer renders the widget."""
+
+    before: list
+    after: list
+    widget_attrs: dict
+    # Template name of the copy of the widget with `widget_attrs` to render, or None to render the widget itself
+    widget_template_name: str | None
+    # Function that renders the widget in Python, or None to render it with its template
+    widget_html_renderer: Callable | None
+
+
+class FormStamper:
+    """
+    Render the forms of a formset by filling in stamps of their fields.
+
+    A stamp is the markup around the widget of a field (wrapper, label, help text and classes) and the attributes the
+    field renderer gives the widget, built once for all fields with the same signature. Each form then only renders its
+    widgets, without a field renderer, and fills in its prefix. Bound forms and fields without a stamp are rendered in
+    full.
+    """
+
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+        self.field_renderer_class = get_field_renderer(**kwargs)
+        form_renderer_class = get_form_renderer(**kwargs)
+        self.can_stamp = (
+            issubclass(form_renderer_class, FormRenderer)
+            and all(
+                getattr(form_renderer_class, name) is getattr(FormRenderer, name)
+                for name in STAMPED_FORM_RENDERER_METHODS
+            )
+            and issubclass(self.field_renderer_class, FieldRenderer)
+            and not self.field_renderer_class.uses_deprecated_widget_attrs_methods
+            and all(
+                getattr(self.field_renderer_class, name) is getattr(FieldRenderer, name)
+                for name in STAMPED_FIELD_RENDERER_METHODS
+            )
+        )
+        self.exclude = parse_exclude(kwargs.get("exclude", ""))
+        self.hidden_as_widget = renders_hidden_fields_as_widget(self.field_renderer_class)
+        self.choice_cache = get_choice_cache(kwargs)
+        self.stamps = {}
+
+    def can_stamp_form(self, form):
+        """Return whether the fields of a form can be rendered from stamps."""
+        return self.can_stamp and not form.is_bound and form.prefix and conditional_escape(form.prefix) == form.prefix
+
+    def get_stamp_key(self, field):
+        """Return key of the stamp for a field, fields with the same key have the same markup and widget attributes."""
+        form = field.form
+        widget = field.field.widget
+        key = (
+            field.name,
+            form.__class__,
+            form.auto_id,
+            form.empty_permitted,
+            field.field.required,
+            field.label,
+            field.help_text,
+            widget.__class__,
+            widget.template_name,
+            getattr(widget, "input_type", None),
+            getattr(widget, "option_template_name", None),
+            tuple(widget.attrs.items()),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def build_stamp(self, field):
+        """Return stamp for a field, or None if it has to be rendered in full."""
+        if field.is_hidden:
+            return None
+        form = copy(field.form)
+        form.prefix = STAMP_PREFIX
+        stamp_field = field.field.get_bound_field(form, field.name)
+        renderer = get_stamp_field_renderer_class(self.field_renderer_class)(stamp_field, **self.kwargs)
+        if renderer.is_multi_widget:
+            return None
+        parts = renderer.render().split(STAMP_FIELD_HTML)
+        if len(parts) != 2:
+            return None
+        before, after = parts
+        # Like `FieldRenderer.get_field_html`
+        widget = renderer.widget
+        widget_template_name = renderer.get_widget_template_name(widget)
+        if widget_template_name == widget.template_name and ADDON_ATTRS.isdisjoint(widget.attrs):
+            widget_template_name = None
+            widget_html_renderer = renderer.get_widget_html_renderer(widget)
+        else:
+            widget_html_renderer = renderer.get_widget_html_renderer(renderer.get_widget_for_render(widget))
+        return FieldStamp(
+            before=before.split(STAMP_PREFIX),
+            after=after.split(STAMP_PREFIX),
+            widget_attrs=renderer.get_widget_attrs(widget),
+            widget_template_name=widget_template_name,
+            widget_html_renderer=widget_html_renderer,
+        )
+
+    def get_stamp(self, field):
+        """Return stamp for a field, building it on first use, or None if the field cannot be stamped."""
+        key = self.get_stamp_key(field)
+        if key is None:
+            return None
+        try:
+            return self.stamps[key]
+        except KeyError:
+            stamp = self.stamps[key] = self.build_stamp(field)
+            return stamp
+
+    def render_widget(self, field, stamp):
+        """Return HTML for the widget of a field with the attributes of its stamp, like `render_widget`."""
+        widget = field.field.widget
+        attrs = stamp.widget_attrs
+        if stamp.widget_template_name is not None:
+            widget = copy(widget)
+            widget.attrs = attrs
+            widget.template_name = stamp.widget_template_name
+            attrs = None
+        choice_cache = get_field_choice_cache(field.field, self.choice_cache)
+        if choice_cache is not None:
+            widget = choice_cache.get_widget(widget)
+        return render_bound_widget(field, widget, attrs, stamp.widget_html_renderer)
+
+    def render_field(self, field):
+        """Return HTML for a field, from its stamp if possible."""
+        if self.hidden_as_widget and field.is_hidden:
+            return text_value(field)
+        stamp = self.get_stamp(field)
+        if stamp is None:
+            return self.field_renderer_class(field, **self.kwargs).render()
+        prefix = field.form.prefix
+        return mark_safe(f"{prefix.join(stamp.before)}{self.render_widget(field, stamp)}{prefix.join(stamp.after)}")
+
+    def render_form(self, form):
+        """Return HTML for a form, like `FormRenderer.render`."""
+        if not self.can_stamp_form(form):
+            return render_form(form, **self.kwargs)
+        return mark_safe("".join(self.render_field(field) for field in form if field.name not in self.exclude))
@@ -14,6 +14,7 @@ from ..forms import (
     render_form,
     render_form_errors,
     render_formset,
+    render_formset_empty_form,
     render_formset_errors,
     render_label,
 )
@@ -227,6 +228,40 @@ def bootstrap_formset(formset, **kwargs):
         formset
             The formset that is being rendered
 
+        parallel
+            Render the forms of the formset concurrently in a thread pool. The formset is validated and the choices
+            of model choice fields are evaluated in the calling thread first, so database queries run inside its
+            transaction; the active language and time zone are used in the worker threads.
+
+            :default: ``False``
+
+        max_workers
+            Maximum number of threads used to render the forms, implies ``parallel=True``
+
+            :default: ``None`` (the default of ``ThreadPoolExecutor``)
+
+        cache_choices
+            Evaluate the queryset of each distinct model choice field once, and reuse its choices for every form
+
+            :default: ``False``
+
+        stamped
+            Render the markup around the widgets (wrapper, label, help text) once per field, and fill in the prefix
+            and widget for every unbound form
+
+            :default: ``False``
+
+        start
+            Index of the first form to render, only applies to unbound formsets. Only allowed for rendering the forms
+            without the management form (``render_formset_forms`` or ``FormsetWindowView``)
+
+            :default: ``0``
+
+        stop
+            Index after the last form to render, only applies to unbound formsets. The management form counts the
+            forms up to this index, load the other forms with ``FormsetWindowView``
+
+            :default: ``None`` (all forms)
 
         See bootstrap_field_ for other arguments
 
@@ -241,6 +276,43 @@ def bootstrap_formset(formset, **kwargs):
     return render_formset(formset, **kwargs)
 
 
+@register.simple_tag
+def bootstrap_formset_empty_form(formset, **kwargs):
+    """
+    Render the empty form of a formset, with ``__prefix__`` in place of the form index.
+
+    The rendered empty form is cached per formset class, prefix, render options and language, so it is only rendered
+    once per process. Use it to add forms to the formset on the client.
+
+    **Tag name**::
+
+        bootstrap_formset_empty_form
+
+    **Parameters**::
+
+        formset
+            The formset of which the empty form is rendered
+
+        cache_empty_form
+            Cache the rendered empty form per process. Formsets with ``form_kwargs``, model and inline formsets,
+            formsets that override ``add_fields()`` and forms with model choice fields are never cached, do not set
+            this if the empty form depends on the request in another way
+
+            :default: ``False``
+
+        See bootstrap_field_ for other arguments
+
+    **Usage**::
+
+        {% bootstrap_formset_empty_form formset %}
+
+    **Example**::
+
+        <template id="empty-form">{% bootstrap_formset_empty_form formset layout='horizontal' %}</template>
+    """
+    return render_formset_empty_form(formset, **kwargs)
+
+
 @register.simple_tag
 def bootstrap_formset_errors(formset, **kwargs):
     """
@@ -298,6 +370,16 @@ def bootstrap_form(form, **kwargs):
 
                 :default: ``'non_fields'``
 
+        cache_choices
+            Evaluate the queryset of each distinct model choice field once, and reuse its choices
+
+            :default: ``False``
+
+        choice_cache
+            A ``ChoiceCache`` to share evaluated choices between several forms
+
+            :default: ``None``
+
         See bootstrap_field_ for other arguments
 
     **Usage**::
@@ -1,14 +1,60 @@
+import os
 from urllib.parse import parse_qs, urlparse, urlunparse
 
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.template.loader import get_template
+from django.utils.autoreload import file_changed
 from django.utils.encoding import force_str
 from django.utils.http import urlencode
 from django.utils.safestring import mark_safe
 
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+_templates = {}
+_default_templates = {}
+
+
+def get_cached_template(template_name):
+    """Return template with given name, loading and compiling it only once per process."""
+    try:
+        return _templates[template_name]
+    except KeyError:
+        template = _templates[template_name] = get_template(template_name)
+        return template
+
+
+def is_default_template(template_name):
+    """Return whether template name resolves to a template of `django-bootstrap5` that is not overridden."""
+    try:
+        return _default_templates[template_name]
+    except KeyError:
+        origin = getattr(get_cached_template(template_name), "origin", None)
+        is_default = origin is not None and os.path.realpath(origin.name) == os.path.realpath(
+            os.path.join(TEMPLATES_DIR, template_name)
+        )
+        _default_templates[template_name] = is_default
+        return is_default
+
+
+@receiver(setting_changed)
+def reset_template_cache_on_setting_changed(*, setting, **kwargs):
+    """Throw away cached templates when template or BOOTSTRAP5 settings change."""
+    if setting in ("TEMPLATES", "BOOTSTRAP5"):
+        _templates.clear()
+        _default_templates.clear()
+
+
+@receiver(file_changed)
+def reset_template_cache_on_file_changed(**kwargs):
+    """Throw away cached templates when the development server sees a changed file."""
+    _templates.clear()
+    _default_templates.clear()
+
 
 def render_template_file(template, context=None):
     """Return rendered template file, with given context as input."""
-    template = get_template(template)
+    template = get_cached_template(template)
     return template.render(context)
 
 
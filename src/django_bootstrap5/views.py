@@ -0,0 +1,60 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.forms.formsets import INITIAL_FORM_COUNT, TOTAL_FORM_COUNT
+from django.http import HttpResponse, HttpResponseBadRequest
+from django.views.generic import View
+
+from .core import get_formset_renderer
+
+
+class FormsetWindowView(View):
+    """
+    Render a window of the forms of a formset, for loading the rows of a large formset on demand.
+
+    The window is taken from the `start` and `stop` query parameters. The response contains the HTML of the forms and
+    the headers `X-Formset-Total-Forms` and `X-Formset-Initial-Forms`, the values for the management form of the page
+    after appending the forms, and `X-Formset-Remaining-Forms`, the number of forms after the window.
+    """
+
+    formset_class = None
+    render_kwargs = {}
+    max_window = 100
+
+    def get_formset_kwargs(self):
+        """Return keyword arguments for the formset."""
+        return {}
+
+    def get_formset(self):
+        """Return the unbound formset to render forms of."""
+        if self.formset_class is None:
+            raise ImproperlyConfigured(f"{self.__class__.__name__} is missing a formset_class.")
+        return self.formset_class(**self.get_formset_kwargs())
+
+    def get_render_kwargs(self):
+        """Return keyword arguments for the formset renderer, these should match the ones used for the page."""
+        return dict(self.render_kwargs)
+
+    def get_window(self):
+        """Return start and stop index from the query parameters, or None if they are not valid."""
+        try:
+            start = int(self.request.GET.get("start", 0))
+            stop = int(self.request.GET.get("stop", start + self.max_window))
+        except ValueError:
+            return None
+        if start < 0 or stop < start or stop - start > self.max_window:
+            return None
+        return start, stop
+
+    def get(self, request, *args, **kwargs):
+        window = self.get_window()
+        if window is None:
+            return HttpResponseBadRequest()
+        start, stop = window
+        formset = self.get_formset()
+        render_kwargs = {**self.get_render_kwargs(), "start": start, "stop": stop}
+        renderer = get_formset_renderer(**render_kwargs)(formset, **render_kwargs)
+        response = HttpResponse(renderer.render_forms())
+        management_data = renderer.get_window_management_data()
+        response["X-Formset-Total-Forms"] = management_data[TOTAL_FORM_COUNT]
+        response["X-Formset-Initial-Forms"] = management_data[INITIAL_FORM_COUNT]
+        response["X-Formset-Remaining-Forms"] = formset.total_form_count() - renderer.get_window()[1]
+        return response
@@ -1,20 +1,210 @@
-from django.forms import EmailInput, NumberInput, PasswordInput, RadioSelect, Textarea, TextInput, URLInput
-
-try:
-    # If Django is set up without a database, importing this widget gives RuntimeError
-    from django.contrib.auth.forms import ReadOnlyPasswordHashWidget
-except RuntimeError:
-    ReadOnlyPasswordHashWidget = None
-
-
-class RadioSelectButtonGroup(RadioSelect):
-    """A RadioSelect that renders as a horizontal button group."""
-
-    template_name = "django_bootstrap5/widgets/radio_select_button_group.html"
-
-
-def is_widget_with_placeholder(widget):
-    """Return whether this widget can have a placeholder."""
-    if isinstance(widget, TextInput):
-        return widget.input_type not in ("color", "range")
-    return isinstance(widget, (TextInput, Textarea, NumberInput, EmailInput, URLInput, PasswordInput))
+from dataclasses import dataclass
+
+from django.forms import (
+    CheckboxInput,
+    CheckboxSelectMultiple,
+    ClearableFileInput,
+    DateInput,
+    DateTimeInput,
+    EmailInput,
+    HiddenInput,
+    MultiWidget,
+    NumberInput,
+    PasswordInput,
+    RadioSelect,
+    Select,
+    SelectMultiple,
+    SplitDateTimeWidget,
+    SplitHiddenDateTimeWidget,
+    Textarea,
+    TextInput,
+    TimeInput,
+    URLInput,
+)
+from django.forms.widgets import Input, Widget
+
+from .choices import get_rendered_select_options
+from .html import (
+    render_input_widget,
+    render_radio_select_button_group_widget,
+    render_radio_select_widget,
+    render_select_widget,
+    render_textarea_widget,
+)
+
+try:
+    # If Django is set up without a database, importing this widget gives RuntimeError
+    from django.contrib.auth.forms import ReadOnlyPasswordHashWidget
+except RuntimeError:
+    ReadOnlyPasswordHashWidget = None
+
+# Input types that are rendered with the `form-control` class.
+FORM_CONTROL_INPUT_TYPES = frozenset(
+    ["text", "number", "email", "url", "tel", "date", "time", "password", "month", "datetime-local"]
+)
+
+
+# Functions that render the context of widgets of these exact classes, identical to their Django templates.
+WIDGET_HTML_RENDERERS = {
+    TextInput: render_input_widget,
+    EmailInput: render_input_widget,
+    NumberInput: render_input_widget,
+    PasswordInput: render_input_widget,
+    URLInput: render_input_widget,
+    DateInput: render_input_widget,
+    DateTimeInput: render_input_widget,
+    TimeInput: render_input_widget,
+    CheckboxInput: render_input_widget,
+    HiddenInput: render_input_widget,
+    Textarea: render_textarea_widget,
+    Select: render_select_widget,
+    SelectMultiple: render_select_widget,
+}
+
+# Multi widgets of these exact classes have their subwidgets rendered in Python, if the subwidgets support that.
+MULTI_WIDGET_CLASSES = frozenset({MultiWidget, SplitDateTimeWidget, SplitHiddenDateTimeWidget})
+
+# Functions that render the context of widgets with these templates of `django-bootstrap5`, identical to the templates.
+TEMPLATE_HTML_RENDERERS = {
+    "django_bootstrap5/widgets/radio_select.html": render_radio_select_widget,
+    "django_bootstrap5/widgets/radio_select_button_group.html": render_radio_select_button_group_widget,
+}
+
+
+class RadioSelectButtonGroup(RadioSelect):
+    """A RadioSelect that renders as a horizontal button group."""
+
+    template_name = "django_bootstrap5/widgets/radio_select_button_group.html"
+
+
+def is_widget_with_placeholder(widget):
+    """Return whether this widget can have a placeholder."""
+    if isinstance(widget, TextInput):
+        return widget.input_type not in ("color", "range")
+    return isinstance(widget, (TextInput, Textarea, NumberInput, EmailInput, URLInput, PasswordInput))
+
+
+@dataclass(frozen=True)
+class WidgetPlan:
+    """How widgets of a class (and input type) are rendered, decided once per widget class and input type."""
+
+    # CSS classes that are put in front of the classes of the widget.
+    base_classes: tuple = ()
+    # Prefix for the size class, such as `form-control` for `form-control-lg`.
+    size_prefix: str = None
+    is_checkbox: bool = False
+    is_form_control: bool = False
+    can_float: bool = False
+    float_requires_default_size: bool = False
+    can_have_addons: bool = False
+    can_have_placeholder: bool = False
+    can_have_server_side_validation: bool = True
+    has_button_size_class: bool = False
+    # Template that replaces the template of the widget, None to keep the template of the widget.
+    template_name: str = None
+
+
+_registered_widget_plans = {}
+_widget_plans = {}
+
+
+def register_widget_plan(widget_class, plan):
+    """Register the `WidgetPlan` for a (custom) widget class and its subclasses."""
+    _registered_widget_plans[widget_class] = plan
+    _widget_plans.clear()
+
+
+def unregister_widget_plan(widget_class):
+    """Remove the registered `WidgetPlan` for a widget class."""
+    del _registered_widget_plans[widget_class]
+    _widget_plans.clear()
+
+
+def build_widget_plan(widget):
+    """Return `WidgetPlan` for widget, based on its class and input type."""
+    input_type = widget.input_type if isinstance(widget, Input) else None
+    is_form_control = (
+        input_type in FORM_CONTROL_INPUT_TYPES if isinstance(widget, Input) else isinstance(widget, Textarea)
+    )
+    is_single_select = isinstance(widget, Select) and not isinstance(widget, (SelectMultiple, RadioSelect))
+    base_classes = ()
+    size_prefix = None
+    if ReadOnlyPasswordHashWidget is not None and isinstance(widget, ReadOnlyPasswordHashWidget):
+        base_classes = ("form-control-plaintext",)
+    elif isinstance(widget, Select):
+        base_classes = ("form-select",)
+        size_prefix = "form-select"
+    elif isinstance(widget, CheckboxInput):
+        base_classes = ("form-check-input",)
+    elif isinstance(widget, (Input, Textarea)):
+        if input_type == "range":
+            base_classes = ("form-range",)
+        else:
+            base_classes = ("form-control", "form-control-color") if input_type == "color" else ("form-control",)
+            size_prefix = "form-control"
+    template_name = None
+    if isinstance(widget, (RadioSelect, CheckboxSelectMultiple)) and not isinstance(widget, RadioSelectButtonGroup):
+        template_name = "django_bootstrap5/widgets/radio_select.html"
+    elif isinstance(widget, ClearableFileInput):
+        template_name = "django_bootstrap5/widgets/clearable_file_input.html"
+    return WidgetPlan(
+        base_classes=base_classes,
+        size_prefix=size_prefix,
+        is_checkbox=isinstance(widget, CheckboxInput),
+        is_form_control=is_form_control,
+        can_float=is_form_control or is_single_select,
+        float_requires_default_size=not is_form_control,
+        can_have_addons=is_form_control or is_single_select,
+        can_have_placeholder=is_widget_with_placeholder(widget),
+        can_have_server_side_validation=input_type != "color",
+        has_button_size_class=isinstance(widget, RadioSelectButtonGroup),
+        template_name=template_name,
+    )
+
+
+def get_widget_plan(widget):
+    """Return the cached `WidgetPlan` for widget, registered plans take precedence over built plans."""
+    key = (widget.__class__, getattr(widget, "input_type", None))
+    try:
+        return _widget_plans[key]
+    except KeyError:
+        pass
+    for widget_class in widget.__class__.__mro__:
+        if widget_class in _registered_widget_plans:
+            plan = _registered_widget_plans[widget_class]
+            break
+    else:
+        plan = build_widget_plan(widget)
+    _widget_plans[key] = plan
+    return plan
+
+
+def get_widget_html_renderer(widget):
+    """Return function that renders widget in Python, or None if the widget has to be rendered with its template."""
+    widget_class = widget.__class__
+    html_renderer = WIDGET_HTML_RENDERERS.get(widget_class)
+    if html_renderer is None or widget.template_name != widget_class.template_name:
+        return None
+    if getattr(widget, "option_template_name", None) != getattr(widget_class, "option_template_name", None):
+        return None
+    return html_renderer
+
+
+def get_template_html_renderer(template_name):
+    """Return function that renders a template of `django-bootstrap5` in Python, or None if there is none."""
+    return TEMPLATE_HTML_RENDERERS.get(template_name)
+
+
+def get_widget_context(widget, name, value, attrs):
+    """Return context of widget to render in Python, select widgets reuse their rendered options if possible."""
+    if widget.__class__ in (Select, SelectMultiple):
+        rendered_options = get_rendered_select_options(widget.choices)
+        if rendered_options is not None:
+            # Like `Select.get_context`, without building the context of every option
+            context = Widget.get_context(widget, name, value, attrs)["widget"]
+            if widget.allow_multiple_selected:
+                context["attrs"]["multiple"] = True
+            context["rendered_options"] = rendered_options
+            context["allow_multiple_selected"] = widget.allow_multiple_selected
+            return context
+    return widget.get_context(name, value, attrs)["widget"]
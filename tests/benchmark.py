@@ -0,0 +1,196 @@
+"""
+Rendering benchmarks.
+
+These benchmarks are not part of the test suite. Run them with `just benchmark` or `python -m tests.benchmark`,
+optionally followed by the names of the benchmarks to run.
+"""
+
+import os
+import sys
+from timeit import timeit
+
+
+def setup_django():
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.app.settings")
+    django.setup()
+
+
+def get_test_formset_class():
+    from django import forms
+
+    class BenchmarkForm(forms.Form):
+        subject = forms.CharField()
+        message = forms.CharField(widget=forms.Textarea, help_text="Your message.")
+        sender = forms.EmailField()
+        cc_myself = forms.BooleanField(required=False)
+
+    return forms.formset_factory(BenchmarkForm)
+
+
+def get_test_formset(num_forms):
+    formset_class = get_test_formset_class()
+    return formset_class(initial=[{"subject": f"Subject {i}"} for i in range(num_forms)])
+
+
+def time_per_call(func, number=3):
+    """Return best time per call of func in seconds."""
+    return min(timeit(func, number=1) for _ in range(number))
+
+
+def benchmark_formset_scaling():
+    """Render formsets of increasing size, time per form should stay roughly constant."""
+    from django_bootstrap5.forms import render_formset
+
+    print(f"{'forms':>8} {'total (s)':>12} {'per form (ms)':>15}")
+    for num_forms in (10, 100, 500, 1000, 2000):
+        formset = get_test_formset(num_forms)
+        seconds = time_per_call(lambda: render_formset(formset))
+        print(f"{num_forms:>8} {seconds:>12.4f} {seconds / num_forms * 1000:>15.4f}")
+
+
+def benchmark_formset_parallel():
+    """Render a formset serially and in a thread pool, use a free-threaded Python build to see a speedup."""
+    from django_bootstrap5.forms import render_formset
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil_enabled}")
+    formset = get_test_formset(1000)
+    serial = time_per_call(lambda: render_formset(formset))
+    print(f"{'serial':>12} {serial:>10.4f} s")
+    for max_workers in (2, 4, 8):
+        seconds = time_per_call(lambda: render_formset(formset, max_workers=max_workers))
+        print(f"{max_workers:>4} workers {seconds:>10.4f} s {serial / seconds:>6.2f}x")
+
+
+def benchmark_select_options():
+    """Render a select field with many options with templates and in Python."""
+    from django import forms
+    from django.test.utils import override_settings
+
+    from django_bootstrap5.forms import render_field
+
+    print(f"{'options':>8} {'template (s)':>14} {'python (s)':>12} {'speedup':>8}")
+    for num_options in (1_000, 10_000, 100_000):
+
+        class SelectForm(forms.Form):
+            choice = forms.ChoiceField(choices=[(i, f"Option {i}") for i in range(num_options)])
+
+        field = SelectForm(data={"choice": "1"})["choice"]
+        with override_settings(BOOTSTRAP5={"python_widget_rendering": False}):
+            template = time_per_call(lambda: render_field(field))
+        with override_settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            python = time_per_call(lambda: render_field(field))
+        print(f"{num_options:>8} {template:>14.4f} {python:>12.4f} {template / python:>7.1f}x")
+
+
+def benchmark_formset_select_options():
+    """Render a formset with a large select in every form, with templates and with reused rendered options."""
+    from django import forms
+    from django.test.utils import override_settings
+
+    from django_bootstrap5.forms import render_formset
+
+    class SelectForm(forms.Form):
+        choice = forms.ChoiceField(choices=[(i, f"Option {i}") for i in range(500)])
+
+    formset = forms.formset_factory(SelectForm, extra=0)(initial=[{"choice": i} for i in range(300)])
+    with override_settings(BOOTSTRAP5={"python_widget_rendering": False}):
+        template = time_per_call(lambda: render_formset(formset), number=1)
+    with override_settings(BOOTSTRAP5={"python_widget_rendering": True}):
+        python = time_per_call(lambda: render_formset(formset), number=1)
+    print(f"300 forms with 500 options: template {template:.4f} s, python {python:.4f} s, {template / python:.1f}x")
+
+
+def benchmark_formset_stamped():
+    """Render formsets in full and from stamps of their fields."""
+    from django.test.utils import override_settings
+
+    from django_bootstrap5.forms import render_formset
+
+    print(f"{'forms':>8} {'full (s)':>10} {'stamped (s)':>12} {'speedup':>8} {'+python (s)':>12} {'speedup':>8}")
+    for num_forms in (100, 500, 1000):
+        formset = get_test_formset(num_forms)
+        full = time_per_call(lambda: render_formset(formset))
+        stamped = time_per_call(lambda: render_formset(formset, stamped=True))
+        # The stamped forms only render their widgets, with the `python_widget_rendering` setting these skip templates
+        with override_settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            python = time_per_call(lambda: render_formset(formset, stamped=True))
+        print(
+            f"{num_forms:>8} {full:>10.4f} {stamped:>12.4f} {full / stamped:>7.1f}x"
+            f" {python:>12.4f} {full / python:>7.1f}x"
+        )
+
+
+def benchmark_async_render():
+    """Render formsets from concurrent async views, wrapped in `sync_to_async` and with `arender_formset`."""
+    import asyncio
+    from time import perf_counter
+
+    from asgiref.sync import sync_to_async
+
+    from django_bootstrap5.forms import arender_formset, render_formset
+
+    async def run(render, concurrency):
+        """Return total time of concurrent renders, and the mean wait of other sync work for the sync thread."""
+        waits = []
+
+        async def other_sync_work():
+            while not done.is_set():
+                start = perf_counter()
+                await sync_to_async(lambda: None)()
+                waits.append(perf_counter() - start)
+                await asyncio.sleep(0.001)
+
+        done = asyncio.Event()
+        start = perf_counter()
+        worker = asyncio.create_task(other_sync_work())
+        await asyncio.gather(*(render(get_test_formset(20)) for _ in range(concurrency)))
+        seconds = perf_counter() - start
+        done.set()
+        await worker
+        return seconds, sum(waits) / len(waits)
+
+    naive = sync_to_async(render_formset)
+    print(f"{'renders':>8} {'naive (s)':>10} {'wait (ms)':>10} {'arender (s)':>12} {'wait (ms)':>10}")
+    for concurrency in (1, 10, 50):
+        naive_seconds, naive_wait = asyncio.run(run(naive, concurrency))
+        async_seconds, async_wait = asyncio.run(run(arender_formset, concurrency))
+        print(
+            f"{concurrency:>8} {naive_seconds:>10.4f} {naive_wait * 1000:>10.2f}"
+            f" {async_seconds:>12.4f} {async_wait * 1000:>10.2f}"
+        )
+
+
+def benchmark_merge_css_classes():
+    """Merge the same CSS classes with and without the cache."""
+    from django_bootstrap5.css import _merge_css_classes, merge_css_classes
+
+    args = ("form-control", "", None, "form-control-lg", "is-invalid")
+    number = 100000
+    cached = timeit(lambda: merge_css_classes(*args), number=number)
+    uncached = timeit(lambda: _merge_css_classes(args), number=number)
+    print(f"{number} merges: cached {cached:.4f} s, uncached {uncached:.4f} s, {uncached / cached:.1f}x")
+
+
+BENCHMARKS = {
+    "formset_scaling": benchmark_formset_scaling,
+    "formset_parallel": benchmark_formset_parallel,
+    "select_options": benchmark_select_options,
+    "formset_select_options": benchmark_formset_select_options,
+    "formset_stamped": benchmark_formset_stamped,
+    "async_render": benchmark_async_render,
+    "merge_css_classes": benchmark_merge_css_classes,
+}
+
+
+def main(names):
+    setup_django()
+    for name in names or BENCHMARKS:
+        print(f"# {name}")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,81 @@
+import threading
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django import forms
+from django.contrib.auth.models import Group
+from django.db.models.sql.compiler import SQLCompiler
+from django.test import TestCase
+
+from django_bootstrap5.forms import (
+    arender_field,
+    arender_form,
+    arender_formset,
+    render_field,
+    render_form,
+    render_formset,
+)
+
+
+class GroupForm(forms.Form):
+    subject = forms.CharField()
+    group = forms.ModelChoiceField(queryset=Group.objects.all())
+    groups = forms.ModelMultipleChoiceField(queryset=Group.objects.all(), required=False)
+
+
+GroupFormSet = forms.formset_factory(GroupForm)
+
+
+class AsyncRenderTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.groups = [Group.objects.create(name=name) for name in ("Alpha", "Beta")]
+
+    def get_formset(self):
+        return GroupFormSet(initial=[{"group": group.pk} for group in self.groups])
+
+    async def test_arender_formset(self):
+        html = await arender_formset(self.get_formset(), layout="horizontal")
+        self.assertEqual(html, await self.async_render(render_formset, self.get_formset(), layout="horizontal"))
+
+    async def test_arender_form(self):
+        form = GroupForm({"subject": "", "group": "0"})
+        html = await arender_form(form)
+        self.assertIn("is-invalid", html)
+        self.assertEqual(html, await self.async_render(render_form, GroupForm({"subject": "", "group": "0"})))
+
+    async def test_arender_field(self):
+        html = await arender_field(GroupForm()["group"], show_label=False)
+        self.assertIn("Alpha", html)
+        self.assertEqual(html, await self.async_render(render_field, GroupForm()["group"], show_label=False))
+
+    async def test_arender_field_validates_in_sync_thread(self):
+        form = GroupForm({"subject": "", "group": "0"})
+        threads = []
+        full_clean = GroupForm.full_clean
+
+        def record_thread(form):
+            threads.append(threading.get_ident())
+            return full_clean(form)
+
+        with mock.patch.object(GroupForm, "full_clean", record_thread):
+            html = await arender_field(form["group"])
+        self.assertIn("is-invalid", html)
+        self.assertEqual(threads, [await sync_to_async(threading.get_ident)()])
+
+    async def test_queries_in_sync_thread(self):
+        threads = []
+        execute_sql = SQLCompiler.execute_sql
+
+        def record_thread(compiler, *args, **kwargs):
+            threads.append(threading.get_ident())
+            return execute_sql(compiler, *args, **kwargs)
+
+        with mock.patch.object(SQLCompiler, "execute_sql", record_thread):
+            await arender_formset(self.get_formset())
+        # One query per distinct set of choices, all before rendering
+        self.assertEqual(len(threads), 2)
+        self.assertEqual(len(set(threads)), 1)
+
+    async def async_render(self, render, *args, **kwargs):
+        return await sync_to_async(render)(*args, **kwargs)
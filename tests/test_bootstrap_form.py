@@ -3,6 +3,7 @@ from django import forms
 from django.forms import formset_factory
 from django.test import override_settings
 
+from django_bootstrap5.forms import aiter_render_form, iter_render_form, render_form
 from tests.base import BootstrapTestCase
 
 
@@ -274,6 +275,24 @@ class DefaultLayoutTestCase(BootstrapTestCase):
             ),
         )
 
+    def test_inline_wrapper_class_passed_to_fields(self):
+        form = ShowLabelTestForm()
+        html = self.render(
+            "{% bootstrap_form form layout='inline' inline_wrapper_class='custom-inline' %}",
+            context={"form": form},
+        )
+        self.assertHTMLEqual(
+            html,
+            (
+                '<div class="col-12 custom-inline django_bootstrap5-req">'
+                '<label class="visually-hidden" for="id_subject">'
+                "Subject"
+                "</label>"
+                '<input class="form-control" id="id_subject" name="subject" placeholder="Subject" required type="text">'
+                "</div>"
+            ),
+        )
+
     @override_settings(
         BOOTSTRAP5={
             "layout": "floating",
@@ -296,3 +315,29 @@ class DefaultLayoutTestCase(BootstrapTestCase):
                 "</div>"
             ),
         )
+
+
+class IterRenderFormTestCase(BootstrapTestCase):
+    def test_iter_render_form(self):
+        form = FormTestForm()
+        chunks = list(iter_render_form(form))
+        self.assertEqual(len(chunks), 2)
+        self.assertIn('name="required_text"', chunks[0])
+        self.assertIn('name="optional_text"', chunks[1])
+        self.assertEqual("".join(chunks), render_form(form))
+
+    def test_iter_render_form_errors(self):
+        form = NonFieldErrorTestForm({"required_text": "foo"})
+        chunks = list(iter_render_form(form))
+        self.assertEqual(len(chunks), 3)
+        self.assertIn(NonFieldErrorTestForm.non_field_error_message, chunks[0])
+        self.assertEqual("".join(chunks), render_form(form))
+
+
+class AsyncIterRenderFormTestCase(BootstrapTestCase):
+    async def test_aiter_render_form(self):
+        form = NonFieldErrorTestForm({"required_text": "foo"})
+        chunks = [chunk async for chunk in aiter_render_form(form, batch_size=2)]
+        self.assertEqual(len(chunks), 2)
+        self.assertIn(NonFieldErrorTestForm.non_field_error_message, chunks[0])
+        self.assertEqual("".join(chunks), render_form(form))
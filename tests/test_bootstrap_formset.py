@@ -1,5 +1,23 @@
+from datetime import UTC, datetime
+from unittest import mock
+
 from django import forms
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import override
 
+from django_bootstrap5.forms import (
+    aiter_render_batches,
+    aiter_render_formset,
+    iter_render_formset,
+    render_form,
+    render_formset,
+    render_formset_empty_form,
+    render_formset_forms,
+)
+from django_bootstrap5.renderers import FieldRenderer, FormStamper, _empty_forms
 from tests.base import BootstrapTestCase
 
 
@@ -41,3 +59,329 @@ class BootstrapFormSetTestCase(BootstrapTestCase):
     def test_illegal_formset(self):
         with self.assertRaises(TypeError):
             self.render("{% bootstrap_formset formset %}", {"formset": "illegal"})
+
+
+class IterRenderFormsetTestCase(BootstrapTestCase):
+    def test_iter_render_formset(self):
+        formset = TestFormSet(initial=[{"subject": "one"}, {"subject": "two"}])
+        chunks = list(iter_render_formset(formset))
+        self.assertEqual(len(chunks), 1 + len(formset.forms))
+        self.assertIn('name="form-TOTAL_FORMS"', chunks[0])
+        self.assertIn('value="one"', chunks[1])
+        self.assertIn('value="two"', chunks[2])
+        self.assertEqual("".join(chunks), render_formset(formset))
+
+    def test_iter_render_formset_errors(self):
+        formset = TestFormSet({"form-TOTAL_FORMS": "a", "form-INITIAL_FORMS": "0"})
+        chunks = list(iter_render_formset(formset))
+        self.assertIn("list-unstyled text-danger", chunks[1])
+        self.assertEqual("".join(chunks), render_formset(formset))
+
+    def test_iter_render_formset_is_lazy(self):
+        formset = TestFormSet(initial=[{"subject": "one"}, {"subject": "two"}])
+        with mock.patch("django_bootstrap5.renderers.render_form", return_value="") as render_form:
+            chunks = iter_render_formset(formset)
+            next(chunks)
+            render_form.assert_not_called()
+            next(chunks)
+            self.assertEqual(render_form.call_count, 1)
+
+    def test_iter_render_illegal_formset(self):
+        with self.assertRaises(TypeError):
+            iter_render_formset("illegal")
+
+
+class AsyncIterRenderFormsetTestCase(BootstrapTestCase):
+    async def test_aiter_render_formset(self):
+        formset = TestFormSet(initial=[{"subject": str(i)} for i in range(24)])
+        chunks = [chunk async for chunk in aiter_render_formset(formset, batch_size=10)]
+        # Management form and 25 forms in batches of 10
+        self.assertEqual(len(chunks), 3)
+        self.assertIn('name="form-TOTAL_FORMS"', chunks[0])
+        self.assertEqual("".join(chunks), render_formset(formset))
+
+    async def test_aiter_render_formset_is_lazy(self):
+        formset = TestFormSet(initial=[{"subject": str(i)} for i in range(24)])
+        with mock.patch("django_bootstrap5.renderers.render_form", return_value="form") as render_form:
+            chunks = aiter_render_formset(formset, batch_size=5)
+            await anext(chunks)
+            self.assertEqual(render_form.call_count, 4)
+            await anext(chunks)
+            self.assertEqual(render_form.call_count, 9)
+
+    async def test_aiter_render_formset_closes_generator(self):
+        formset = TestFormSet(initial=[{"subject": str(i)} for i in range(24)])
+        closed = []
+
+        def iter_render():
+            try:
+                yield from iter_render_formset(formset)
+            finally:
+                closed.append(True)
+
+        chunks = aiter_render_batches(iter_render, batch_size=5)
+        await anext(chunks)
+        await chunks.aclose()
+        self.assertEqual(closed, [True])
+
+
+class ParallelFormsetTestCase(BootstrapTestCase):
+    def test_parallel_formset(self):
+        formset = TestFormSet(initial=[{"subject": f"subject {i}"} for i in range(20)])
+        self.assertEqual(render_formset(formset, parallel=True), render_formset(formset))
+        self.assertEqual(render_formset(formset, max_workers=4), render_formset(formset))
+
+    def test_parallel_formset_tag(self):
+        formset = TestFormSet()
+        self.assertEqual(
+            self.render("{% bootstrap_formset formset parallel=True max_workers=2 %}", {"formset": formset}),
+            self.render("{% bootstrap_formset formset %}", {"formset": formset}),
+        )
+
+    def test_parallel_formset_keeps_language(self):
+        formset = TestFormSet({"form-TOTAL_FORMS": 2, "form-INITIAL_FORMS": 0, "form-0-subject": "subject"})
+        with override("nl"):
+            html = render_formset(formset, parallel=True)
+            self.assertEqual(html, render_formset(formset))
+        self.assertIn("Dit veld is verplicht.", html)
+
+    def test_parallel_formset_keeps_timezone(self):
+        formset = TimeFormSet(initial=[{"moment": datetime(2024, 1, 1, 21, 0, tzinfo=UTC)}] * 2)
+        with timezone.override("Asia/Tokyo"):
+            html = render_formset(formset, parallel=True)
+            self.assertEqual(html, render_formset(formset))
+        self.assertIn("2024-01-02 06:00:00", html)
+
+    def test_parallel_formset_model_choices_in_transaction(self):
+        with transaction.atomic():
+            Group.objects.create(name="created in transaction")
+            html = render_formset(GroupFormSet(initial=[{}] * 2), parallel=True)
+        self.assertEqual(html.count("created in transaction"), 2)
+
+
+class TimeForm(forms.Form):
+    moment = forms.DateTimeField()
+
+
+TimeFormSet = forms.formset_factory(TimeForm, extra=0)
+
+
+class GroupForm(forms.Form):
+    group = forms.ModelChoiceField(queryset=Group.objects.all())
+
+
+GroupFormSet = forms.formset_factory(GroupForm, extra=0)
+
+
+class StampedTestForm(forms.Form):
+    subject = forms.CharField(help_text="Subject <help>", widget=forms.TextInput(attrs={"addon_before": "@"}))
+    message = forms.CharField(widget=forms.Textarea, required=False)
+    amount = forms.DecimalField(label="Amount (€)")
+    cc_myself = forms.BooleanField(required=False)
+    color = forms.ChoiceField(choices=[("r", "Red"), ("g", "Green")], widget=forms.RadioSelect)
+    when = forms.SplitDateTimeField(required=False)
+    attachment = forms.FileField(required=False)
+    secret = forms.CharField(widget=forms.HiddenInput, required=False)
+    fixed = forms.CharField(required=False, widget=forms.TextInput(attrs={"id": "fixed-id"}))
+
+
+StampedTestFormSet = forms.formset_factory(StampedTestForm, extra=2, can_delete=True, can_order=True)
+
+
+class StampedFormsetTestCase(BootstrapTestCase):
+    def get_formset(self, **kwargs):
+        initial = [{"subject": f"<subject {i}>", "amount": i, "color": "g", "cc_myself": i % 2} for i in range(5)]
+        return StampedTestFormSet(initial=initial, **kwargs)
+
+    def assertStampedEqual(self, formset, **kwargs):
+        self.assertEqual(render_formset(formset, stamped=True, **kwargs), render_formset(formset, **kwargs))
+
+    def test_stamped_formset(self):
+        self.assertStampedEqual(self.get_formset())
+        self.assertStampedEqual(self.get_formset(prefix="items"))
+        self.assertStampedEqual(TestFormSet())
+
+    def test_stamped_layouts(self):
+        formset = self.get_formset()
+        self.assertStampedEqual(formset, layout="horizontal")
+        self.assertStampedEqual(formset, layout="floating")
+        self.assertStampedEqual(formset, layout="inline", size="sm")
+        self.assertStampedEqual(formset, show_label=False, show_help=False, exclude="message,when")
+        self.assertStampedEqual(formset, checkbox_style="switch", server_side_validation=False)
+
+    def test_stamped_python_widget_rendering(self):
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            self.assertStampedEqual(self.get_formset())
+            self.assertStampedEqual(self.get_formset(), layout="floating", size="lg")
+
+    def test_stamped_forms_do_not_construct_field_renderers(self):
+        formset = TestFormSet(initial=[{"subject": f"subject {i}"} for i in range(20)])
+        with mock.patch.object(FieldRenderer, "__init__", autospec=True, side_effect=FieldRenderer.__init__) as init:
+            render_formset(formset, stamped=True)
+        # One field renderer per stamp, for the initial forms and for the extra form
+        self.assertEqual(init.call_count, 2 * len(TestForm.base_fields))
+
+    def test_stamped_parallel(self):
+        self.assertStampedEqual(self.get_formset(), max_workers=2)
+
+    def test_stamped_bound_formset(self):
+        data = {
+            "form-TOTAL_FORMS": 2,
+            "form-INITIAL_FORMS": 0,
+            "form-0-subject": "subject",
+            "form-0-amount": "not a number",
+        }
+        self.assertStampedEqual(self.get_formset(data=data))
+
+    def test_stamps_are_reused(self):
+        formset = self.get_formset()
+        with mock.patch.object(FormStamper, "build_stamp", autospec=True, side_effect=FormStamper.build_stamp) as build:
+            render_formset(formset, stamped=True)
+        # One stamp per visible field for the initial forms and for the extra forms (their required classes differ)
+        visible_fields = formset.forms[0].visible_fields()
+        self.assertEqual(build.call_count, 2 * len(visible_fields))
+
+    def test_custom_field_renderer_is_not_stamped(self):
+        field_renderers = {"default": "tests.test_bootstrap_formset.PerFormFieldRenderer"}
+        formset = self.get_formset()
+        with self.settings(BOOTSTRAP5={"field_renderers": field_renderers}):
+            html = render_formset(formset, stamped=True)
+            self.assertEqual(html, render_formset(formset))
+        self.assertIn("amount-0", html)
+        self.assertIn("amount-4", html)
+
+
+class PerFormFieldRenderer(FieldRenderer):
+    def get_wrapper_classes(self):
+        return f"amount-{self.field.form.initial.get('amount')}"
+
+
+class EmptyFormTestCase(BootstrapTestCase):
+    def test_empty_form(self):
+        formset = TestFormSet()
+        html = self.render("{% bootstrap_formset_empty_form formset %}", {"formset": formset})
+        self.assertEqual(html, render_form(formset.empty_form))
+        self.assertIn('name="form-__prefix__-subject"', html)
+        self.assertNotIn("TOTAL_FORMS", html)
+
+    def test_empty_form_is_cached(self):
+        formset = TestFormSet(prefix="cached")
+        html = render_formset_empty_form(formset, cache_empty_form=True)
+        with mock.patch("django_bootstrap5.renderers.render_form") as render:
+            self.assertEqual(render_formset_empty_form(TestFormSet(prefix="cached"), cache_empty_form=True), html)
+            render.assert_not_called()
+            render_formset_empty_form(TestFormSet(prefix="cached"), cache_empty_form=True, layout="horizontal")
+            render_formset_empty_form(TestFormSet(prefix="other"), cache_empty_form=True)
+            render_formset_empty_form(TestFormSet(prefix="cached"))
+            with override("nl"):
+                render_formset_empty_form(TestFormSet(prefix="cached"), cache_empty_form=True)
+            self.assertEqual(render.call_count, 4)
+
+    def test_empty_form_cache_is_cleared(self):
+        formset = TestFormSet(prefix="cleared")
+        html = render_formset_empty_form(formset, cache_empty_form=True)
+        with self.settings(BOOTSTRAP5={"wrapper_class": "custom-wrapper"}):
+            self.assertIn("custom-wrapper", render_formset_empty_form(formset, cache_empty_form=True))
+        self.assertEqual(render_formset_empty_form(formset, cache_empty_form=True), html)
+
+    def test_empty_form_with_form_kwargs_is_not_cached(self):
+        formset_class = forms.formset_factory(UserTestForm)
+        alice = render_formset_empty_form(formset_class(form_kwargs={"user": "alice"}), cache_empty_form=True)
+        bob = render_formset_empty_form(formset_class(form_kwargs={"user": "bob"}), cache_empty_form=True)
+        self.assertIn("alice", alice)
+        self.assertIn("bob", bob)
+
+    def test_empty_form_with_model_choices_is_not_cached(self):
+        formset_class = forms.formset_factory(GroupTestForm)
+        Group.objects.create(name="Alpha")
+        self.assertIn("Alpha", render_formset_empty_form(formset_class(), cache_empty_form=True))
+        Group.objects.create(name="Beta")
+        self.assertIn("Beta", render_formset_empty_form(formset_class(), cache_empty_form=True))
+
+    def test_empty_form_of_inline_formset_is_not_cached(self):
+        formset_class = forms.inlineformset_factory(ContentType, Permission, fields=("name", "codename"))
+        for model in (Group, Permission):
+            content_type = ContentType.objects.get_for_model(model)
+            html = render_formset_empty_form(formset_class(instance=content_type), cache_empty_form=True)
+            self.assertIn(f'value="{content_type.pk}"', html)
+
+    def test_empty_form_cache_is_bounded(self):
+        with mock.patch("django_bootstrap5.renderers.EMPTY_FORMS_MAXSIZE", 2):
+            for prefix in ("bounded-1", "bounded-2", "bounded-1", "bounded-3"):
+                render_formset_empty_form(TestFormSet(prefix=prefix), cache_empty_form=True)
+            prefixes = {key[2] for key in _empty_forms}
+        self.assertEqual(prefixes, {"bounded-1", "bounded-3"})
+
+
+class UserTestForm(forms.Form):
+    subject = forms.CharField()
+
+    def __init__(self, *args, user, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["subject"].help_text = f"Subject for {user}"
+
+
+class GroupTestForm(forms.Form):
+    group = forms.ModelChoiceField(queryset=Group.objects.all())
+
+
+WindowTestFormSet = forms.formset_factory(TestForm, extra=2)
+
+
+class WindowedFormsetTestCase(BootstrapTestCase):
+    def get_initial(self):
+        return [{"subject": f"Subject {i}", "date": "2026-01-01"} for i in range(5)]
+
+    def test_windowed_formset(self):
+        formset = WindowTestFormSet(initial=self.get_initial())
+        html = render_formset(formset, stop=3)
+        self.assertIn('name="form-TOTAL_FORMS" value="3"', html)
+        self.assertIn('name="form-INITIAL_FORMS" value="3"', html)
+        self.assertIn('name="form-2-subject"', html)
+        self.assertNotIn('name="form-3-subject"', html)
+        self.assertNotIn("forms", formset.__dict__)
+
+    def test_window_matches_full_render(self):
+        formset = WindowTestFormSet(initial=self.get_initial())
+        self.assertEqual(
+            render_formset_forms(formset, stop=3) + render_formset_forms(formset, start=3, stop=7),
+            render_formset_forms(formset),
+        )
+        self.assertEqual(render_formset(formset, start=0, stop=100), render_formset(formset))
+
+    def test_full_render_with_start_is_rejected(self):
+        formset = WindowTestFormSet(initial=self.get_initial())
+        with self.assertRaises(ValueError):
+            render_formset(formset, start=2, stop=4)
+        with self.assertRaises(ValueError):
+            self.render("{% bootstrap_formset formset start=2 %}", {"formset": formset})
+
+    def test_window_of_extra_forms(self):
+        formset = WindowTestFormSet(initial=self.get_initial())
+        html = render_formset(formset, stop=6)
+        self.assertIn('name="form-TOTAL_FORMS" value="6"', html)
+        self.assertIn('name="form-INITIAL_FORMS" value="5"', html)
+
+    def test_windowed_formset_validates(self):
+        initial = self.get_initial()
+        data = {"form-TOTAL_FORMS": "3", "form-INITIAL_FORMS": "3", "form-MIN_NUM_FORMS": "0"}
+        for i in range(3):
+            data[f"form-{i}-subject"] = initial[i]["subject"]
+            data[f"form-{i}-date"] = initial[i]["date"]
+        self.assertIn('name="form-TOTAL_FORMS" value="3"', render_formset(WindowTestFormSet(initial=initial), stop=3))
+        formset = WindowTestFormSet(data, initial=initial[:3])
+        self.assertTrue(formset.is_valid())
+
+    def test_bound_formset_renders_all_forms(self):
+        data = {"form-TOTAL_FORMS": "2", "form-INITIAL_FORMS": "0", "form-0-subject": "a", "form-1-subject": "b"}
+        formset = WindowTestFormSet(data)
+        html = render_formset(formset, stop=1)
+        self.assertIn('name="form-TOTAL_FORMS" value="2"', html)
+        self.assertIn('name="form-1-subject"', html)
+
+    def test_windowed_formset_tag(self):
+        html = self.render(
+            "{% bootstrap_formset formset stop=1 %}", {"formset": WindowTestFormSet(initial=self.get_initial())}
+        )
+        self.assertIn('name="form-0-subject"', html)
+        self.assertNotIn('name="form-1-subject"', html)
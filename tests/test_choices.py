@@ -0,0 +1,254 @@
+from unittest import mock
+
+from django import forms
+from django.contrib.auth.models import Group, Permission
+from django.test import TestCase
+from django.utils.translation import override
+
+from django_bootstrap5.choices import (
+    CachedChoices,
+    ChoiceCache,
+    cached_choices,
+    get_choices_key,
+    get_rendered_select_options,
+    get_static_choices_key,
+    register_cached_choices,
+    shared_choice_cache,
+    unregister_cached_choices,
+)
+from django_bootstrap5.forms import render_form, render_formset
+from django_bootstrap5.html import RenderedSelectOptions, render_select_widget
+
+
+class GroupForm(forms.Form):
+    group = forms.ModelChoiceField(queryset=Group.objects.all())
+    groups = forms.ModelMultipleChoiceField(queryset=Group.objects.all(), required=False)
+    named_group = forms.ModelChoiceField(queryset=Group.objects.filter(name__startswith="B"), to_field_name="name")
+
+
+GroupFormSet = forms.formset_factory(GroupForm)
+
+
+class ChoiceCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.groups = [Group.objects.create(name=name) for name in ("Alpha", "Beta", "<Bravo>")]
+
+    def get_formset(self, num_forms):
+        return GroupFormSet(initial=[{"group": self.groups[i % 3].pk} for i in range(num_forms)])
+
+    def test_query_count_is_constant(self):
+        for num_forms in (1, 5, 20):
+            formset = self.get_formset(num_forms)
+            # One query per distinct set of choices, the multiple choice field has no empty label
+            with self.assertNumQueries(3):
+                render_formset(formset, cache_choices=True)
+
+    def test_without_cache(self):
+        formset = self.get_formset(5)
+        # One query per field per form, including the extra form
+        with self.assertNumQueries(18):
+            render_formset(formset)
+
+    def test_same_html(self):
+        formset = self.get_formset(4)
+        self.assertEqual(render_formset(formset, cache_choices=True), render_formset(formset))
+        formset = GroupFormSet(data={"form-TOTAL_FORMS": "1", "form-INITIAL_FORMS": "0", "form-0-groups": ["1", "2"]})
+        self.assertEqual(render_formset(formset, cache_choices=True), render_formset(formset))
+
+    def test_shared_cache(self):
+        choice_cache = ChoiceCache()
+        with self.assertNumQueries(3):
+            for _ in range(3):
+                render_form(GroupForm(), choice_cache=choice_cache)
+        self.assertEqual(len(choice_cache), 3)
+
+    def test_widget_is_not_changed(self):
+        form = GroupForm()
+        choice_cache = ChoiceCache()
+        widget = form.fields["group"].widget
+        cached_widget = choice_cache.get_widget(widget)
+        self.assertIsNot(cached_widget, widget)
+        self.assertIsInstance(cached_widget.choices, CachedChoices)
+        self.assertEqual(len(cached_widget.choices), 4)
+        select = forms.Select(choices=[("a", "A")])
+        self.assertIs(choice_cache.get_widget(select), select)
+
+    def test_choices_key(self):
+        form = GroupForm()
+        group_key = get_choices_key(form.fields["group"].widget.choices)
+        self.assertEqual(group_key, get_choices_key(GroupForm().fields["group"].widget.choices))
+        self.assertNotEqual(group_key, get_choices_key(form.fields["groups"].widget.choices))
+        self.assertNotEqual(group_key, get_choices_key(form.fields["named_group"].widget.choices))
+        form.fields["group"].empty_label = "Choose"
+        self.assertNotEqual(group_key, get_choices_key(form.fields["group"].widget.choices))
+        form.fields["group"].queryset = Group.objects.none()
+        self.assertIsNone(get_choices_key(form.fields["group"].widget.choices))
+
+
+class CachedGroupForm(forms.Form):
+    group = cached_choices(forms.ModelChoiceField(queryset=Group.objects.all()), cache_options_html=True)
+    other_group = forms.ModelChoiceField(queryset=Group.objects.all(), required=False)
+
+
+class SharedChoiceCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.groups = [Group.objects.create(name=name) for name in ("Alpha", "Beta", "<Bravo>")]
+
+    def setUp(self):
+        shared_choice_cache.clear()
+
+    def tearDown(self):
+        unregister_cached_choices(Group)
+
+    def test_cached_choices_field(self):
+        with self.assertNumQueries(2):
+            render_form(CachedGroupForm())
+        with self.assertNumQueries(1):
+            render_form(CachedGroupForm())
+        self.assertEqual(len(shared_choice_cache), 1)
+
+    def test_register_cached_choices(self):
+        register_cached_choices(Group)
+        with self.assertNumQueries(3):
+            render_form(GroupForm())
+        with self.assertNumQueries(0):
+            html = render_form(GroupForm())
+        unregister_cached_choices(Group)
+        self.assertEqual(len(shared_choice_cache), 0)
+        self.assertEqual(render_form(GroupForm()), html)
+
+    def test_invalidation(self):
+        register_cached_choices(Group)
+        render_form(GroupForm())
+        group = Group.objects.create(name="Charlie")
+        self.assertEqual(len(shared_choice_cache), 0)
+        self.assertIn("Charlie", render_form(GroupForm()))
+        group.delete()
+        self.assertEqual(len(shared_choice_cache), 0)
+        render_form(GroupForm())
+        self.groups[0].permissions.add(Permission.objects.first())
+        self.assertEqual(len(shared_choice_cache), 0)
+
+    def test_invalidation_on_commit(self):
+        register_cached_choices(Group)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            group = Group.objects.create(name="Charlie")
+            # Choices cached before the change is committed are stale
+            render_form(GroupForm())
+            self.assertNotEqual(len(shared_choice_cache), 0)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(len(shared_choice_cache), 0)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            group.permissions.add(Permission.objects.first())
+        self.assertEqual(len(callbacks), 2)
+
+    def test_ttl_and_maxsize(self):
+        register_cached_choices(Group)
+        with self.settings(BOOTSTRAP5={"cached_choices_ttl": 0}):
+            render_form(GroupForm())
+            with self.assertNumQueries(3):
+                render_form(GroupForm())
+        with self.settings(BOOTSTRAP5={"cached_choices_maxsize": 2}):
+            render_form(GroupForm())
+            self.assertEqual(len(shared_choice_cache), 2)
+
+    def test_language(self):
+        register_cached_choices(Group)
+        with override("en"):
+            render_form(GroupForm())
+        with override("nl"):
+            with self.assertNumQueries(3):
+                render_form(GroupForm())
+
+    def test_cache_options_html(self):
+        data = {"group": self.groups[2].pk, "other_group": "invalid"}
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": False}):
+            expected = [render_form(CachedGroupForm(data=data)), render_form(CachedGroupForm())]
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            self.assertEqual(render_form(CachedGroupForm(data=data)), expected[0])
+            self.assertEqual(render_form(CachedGroupForm()), expected[1])
+            self.assertEqual(render_form(CachedGroupForm(data=data)), expected[0])
+            ((_expires, _model, choices),) = shared_choice_cache._choices.values()
+            self.assertIsNotNone(choices._rendered_options)
+        self.assertEqual(expected[0].count(" selected>"), 1)
+
+    def test_cached_choices_requires_model_choice_field(self):
+        with self.assertRaises(TypeError):
+            cached_choices(forms.ChoiceField())
+
+
+class RenderedSelectOptionsTestCase(TestCase):
+    def test_render(self):
+        choices = [("", "---"), ("Group", [("a", "A"), ("b", "B")]), ("a", "A again"), (None, "None")]
+        options = RenderedSelectOptions(choices)
+        self.assertIs(options.render([]), options.html)
+        self.assertEqual(options.render(["x"]), options.html)
+        self.assertEqual(options.render(["a"]).count(" selected>"), 1)
+        self.assertEqual(options.render(["a"], allow_multiple_selected=True).count(" selected>"), 2)
+        self.assertIn(
+            '<option value="" selected>None</option>', options.render(["x", ""], allow_multiple_selected=True)
+        )
+        for values, multiple in ((["b"], False), (["a", "b"], True), ([""], False), ([], True)):
+            widget = forms.SelectMultiple(choices=choices) if multiple else forms.Select(choices=choices)
+            html = render_select_widget(widget.get_context("name", values, {})["widget"])
+            self.assertEqual(html, widget.render("name", values), values)
+            context = widget.get_context("name", values, {})["widget"]
+            context.update(rendered_options=options, allow_multiple_selected=multiple)
+            self.assertEqual(render_select_widget(context), html, values)
+
+
+class ChoiceForm(forms.Form):
+    choice = forms.ChoiceField(choices=[(i, f"Option {i}") for i in range(50)])
+    group = forms.ModelChoiceField(queryset=Group.objects.all(), required=False)
+
+
+ChoiceFormSet = forms.formset_factory(ChoiceForm, extra=0)
+
+
+class ReusedOptionsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.groups = [Group.objects.create(name=name) for name in ("Alpha", "Beta", "<Bravo>")]
+
+    def get_formset(self):
+        return ChoiceFormSet(initial=[{"choice": i, "group": self.groups[i % 3].pk} for i in range(10)])
+
+    def test_options_are_rendered_once(self):
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": False}):
+            expected = render_formset(self.get_formset())
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            with mock.patch(
+                "django_bootstrap5.choices.RenderedSelectOptions", side_effect=RenderedSelectOptions
+            ) as rendered_options:
+                self.assertEqual(render_formset(self.get_formset(), cache_choices=True), expected)
+                self.assertEqual(render_formset(self.get_formset()), expected)
+        # Static choices once for both renders, model choices once per render with a choice cache
+        self.assertEqual(rendered_options.call_count, 2)
+
+    def test_label_classes_are_not_shared(self):
+        class OneForm(forms.Form):
+            choice = forms.ChoiceField(choices=[("a", 1)])
+
+        class TrueForm(forms.Form):
+            choice = forms.ChoiceField(choices=[("a", True)])
+
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            self.assertIn(">1</option>", render_form(OneForm()))
+            self.assertIn(">True</option>", render_form(TrueForm()))
+
+    def test_static_choices_key(self):
+        self.assertEqual(get_static_choices_key([(1, "One")]), get_static_choices_key([(1, "One")]))
+        self.assertNotEqual(get_static_choices_key([(1, "One")]), get_static_choices_key([(True, "One")]))
+        self.assertNotEqual(get_static_choices_key([("a", 1)]), get_static_choices_key([("a", True)]))
+        self.assertNotEqual(
+            get_static_choices_key([("Group", [("a", 1)])]), get_static_choices_key([("Group", [("a", True)])])
+        )
+        self.assertIsNotNone(get_static_choices_key([("Group", [("a", "A")])]))
+        self.assertNotEqual(get_static_choices_key([(1, "One")]), get_static_choices_key([(1, "One"), (2, "Two")]))
+        key = get_static_choices_key([(1, "One")])
+        with override("nl"):
+            self.assertNotEqual(get_static_choices_key([(1, "One")]), key)
+        self.assertIsNone(get_static_choices_key([({}, "Unhashable")]))
+        self.assertIsNone(get_rendered_select_options(forms.Select(choices=lambda: [(1, "One")]).choices))
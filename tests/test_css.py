@@ -1,6 +1,8 @@
 from django.test import TestCase
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy, override
 
-from django_bootstrap5.css import merge_css_classes
+from django_bootstrap5.css import _merge_cached_css_classes, merge_css_classes
 
 
 class MergeCssClassesTestCase(TestCase):
@@ -23,3 +25,36 @@ class MergeCssClassesTestCase(TestCase):
 
     def test_merge_non_string_parameters(self):
         self.assertEqual(merge_css_classes("", False), "False")
+
+    def test_merge_single_parameter(self):
+        self.assertEqual(merge_css_classes("foo"), "foo")
+        self.assertEqual(merge_css_classes("foo  foo bar"), "foo bar")
+        self.assertEqual(merge_css_classes(None), "")
+
+    def test_merge_lazy_and_safe_parameters(self):
+        with override("en"):
+            self.assertEqual(merge_css_classes(gettext_lazy("Yes"), "foo"), "Yes foo")
+        with override("nl"):
+            self.assertEqual(merge_css_classes(gettext_lazy("Yes"), "foo"), "Ja foo")
+        self.assertEqual(merge_css_classes(mark_safe("foo bar"), "foo"), "foo bar")
+
+    def test_merge_does_not_confuse_equal_values(self):
+        self.assertEqual(merge_css_classes("", 0), "0")
+        self.assertEqual(merge_css_classes("", False), "False")
+
+
+class MergeCssClassesCacheTestCase(TestCase):
+    args = ("form-control", "", None, "form-control-lg", "is-invalid")
+
+    def test_merge_is_cached(self):
+        merge_css_classes(*self.args)
+        hits = _merge_cached_css_classes.cache_info().hits
+        merge_css_classes(*self.args)
+        self.assertEqual(_merge_cached_css_classes.cache_info().hits, hits + 1)
+
+    def test_repeated_merge_is_not_recomputed(self):
+        merge_css_classes(*self.args)
+        misses = _merge_cached_css_classes.cache_info().misses
+        for _ in range(10):
+            merge_css_classes(*self.args)
+        self.assertEqual(_merge_cached_css_classes.cache_info().misses, misses)
@@ -55,6 +55,13 @@ class Jinja2TestCase(BootstrapTestCase):
             self.render("{{ bootstrap_formset(formset) }}", context={"formset": formset}),
         )
 
+    def test_formset_empty_form(self):
+        formset = TestFormSet()
+        self.assertIn(
+            'name="form-__prefix__-subject"',
+            self.render("{{ bootstrap_formset_empty_form(formset) }}", context={"formset": formset}),
+        )
+
     def test_label(self):
         self.assertHTMLEqual(
             self.render('{{ bootstrap_label("Subject") }}'),
@@ -0,0 +1,197 @@
+from unittest import mock
+
+from django import forms
+from django.forms import BoundField
+from django.test import TestCase
+
+from django_bootstrap5.forms import render_field, render_form
+from django_bootstrap5.renderers import FieldRenderer, FormRenderer, FormsetRenderer, RenderOptions, parse_exclude
+
+
+class RenderersTestForm(forms.Form):
+    subject = forms.CharField()
+    message = forms.CharField(widget=forms.Textarea)
+
+
+class WidgetTestForm(forms.Form):
+    amount = forms.DecimalField(widget=forms.NumberInput(attrs={"addon_before": "$", "class": "amount"}))
+    choice = forms.ChoiceField(choices=[("a", "A"), ("b", "B")], widget=forms.RadioSelect)
+    when = forms.SplitDateTimeField()
+    attachment = forms.FileField(required=False)
+
+
+class RenderOptionsTestCase(TestCase):
+    def test_from_kwargs(self):
+        render_options = RenderOptions.from_kwargs({"layout": "horizontal", "size": "lg"})
+        self.assertEqual(render_options.layout, "horizontal")
+        self.assertEqual(render_options.size, "lg")
+        self.assertEqual(render_options.wrapper_class, "mb-3")
+        self.assertEqual(render_options.horizontal_label_class, "col-sm-2")
+
+    def test_from_kwargs_invalid_size(self):
+        with self.assertRaises(ValueError):
+            RenderOptions.from_kwargs({"size": "xl"})
+
+    def test_with_overrides(self):
+        render_options = RenderOptions.from_kwargs({})
+        self.assertIs(render_options.with_overrides({}), render_options)
+        self.assertIs(render_options.with_overrides({"wrapper_class": "mb-3", "label": "ignored"}), render_options)
+        overridden = render_options.with_overrides({"wrapper_class": "mb-5", "size": "sm"})
+        self.assertEqual(overridden.wrapper_class, "mb-5")
+        self.assertEqual(overridden.size, "sm")
+        self.assertEqual(render_options.wrapper_class, "mb-3")
+
+    def test_shared_with_child_renderers(self):
+        form = RenderersTestForm()
+        form_renderer = FormRenderer(form, layout="horizontal")
+        kwargs = form_renderer.get_kwargs()
+        field_renderer = FieldRenderer(form["subject"], **kwargs)
+        self.assertIs(field_renderer.render_options, form_renderer.render_options)
+        field_renderer = FieldRenderer(form["subject"], **{**kwargs, "show_label": False})
+        self.assertIsNot(field_renderer.render_options, form_renderer.render_options)
+        self.assertFalse(field_renderer.show_label)
+        self.assertEqual(field_renderer.layout, "horizontal")
+
+
+class WidgetUnchangedTestCase(TestCase):
+    def assertWidgetsUnchanged(self, form):
+        widgets = [field.widget for field in form.fields.values()]
+        widgets += [subwidget for widget in widgets for subwidget in getattr(widget, "widgets", [])]
+        expected = [(widget.attrs.copy(), widget.template_name) for widget in widgets]
+        for layout in ["", "horizontal", "floating"]:
+            render_form(form, layout=layout)
+            self.assertEqual([(widget.attrs, widget.template_name) for widget in widgets], expected)
+
+    def test_widgets_unchanged(self):
+        self.assertWidgetsUnchanged(WidgetTestForm())
+
+    def test_widgets_unchanged_bound(self):
+        self.assertWidgetsUnchanged(WidgetTestForm({"amount": "x"}))
+
+    def test_addon_attrs_not_rendered(self):
+        form = WidgetTestForm()
+        html = render_field(form["amount"])
+        self.assertInHTML('<span class="input-group-text">$</span>', html)
+        self.assertNotIn("addon_before", html)
+        self.assertIn('class="form-control amount"', html)
+        self.assertEqual(html, render_field(form["amount"]))
+
+    def test_get_widget_attrs(self):
+        form = WidgetTestForm()
+        field_renderer = FieldRenderer(form["amount"])
+        self.assertEqual(
+            field_renderer.get_widget_attrs(), {"class": "form-control amount", "step": "any", "placeholder": "Amount"}
+        )
+        self.assertEqual(form.fields["amount"].widget.attrs, {"addon_before": "$", "class": "amount", "step": "any"})
+
+
+class CompactRendererTestCase(TestCase):
+    def test_no_instance_dict(self):
+        form = RenderersTestForm()
+        for renderer in (
+            FieldRenderer(form["subject"]),
+            FormRenderer(form),
+            FormsetRenderer(forms.formset_factory(RenderersTestForm)()),
+        ):
+            with self.subTest(renderer=renderer.__class__.__name__):
+                self.assertFalse(hasattr(renderer, "__dict__"))
+
+    def test_lazy_attributes(self):
+        form = RenderersTestForm({"subject": ""})
+        with mock.patch.object(BoundField, "errors", new_callable=mock.PropertyMock, return_value=[]) as errors:
+            renderer = FieldRenderer(form["subject"], exclude="subject")
+            self.assertEqual(renderer.render(), "")
+            errors.assert_not_called()
+        self.assertEqual(renderer.field_errors, ["This field is required."])
+        self.assertEqual(renderer.placeholder, "Subject")
+
+    def test_subclass_assigns_attributes(self):
+        class CustomFieldRenderer(FieldRenderer):
+            def __init__(self, field, **kwargs):
+                super().__init__(field, **kwargs)
+                self.help_text = "Custom help"
+                self.custom = "custom"
+
+        renderer = CustomFieldRenderer(RenderersTestForm()["subject"])
+        self.assertEqual(renderer.custom, "custom")
+        self.assertIn("Custom help", renderer.render())
+
+
+class HiddenTestForm(forms.Form):
+    subject = forms.CharField()
+    message = forms.CharField(widget=forms.Textarea)
+    tracking = forms.CharField(widget=forms.HiddenInput, initial="abc")
+
+
+class BracketFieldRenderer(FieldRenderer):
+    def render(self):
+        return f"[{self.field.name}]"
+
+
+class SkippedFieldsTestCase(TestCase):
+    def test_parse_exclude(self):
+        self.assertEqual(parse_exclude("subject, message"), {"subject", "message"})
+        self.assertIs(parse_exclude("subject, message"), parse_exclude("subject, message"))
+
+    def test_excluded_and_hidden_fields_skip_field_renderer(self):
+        form = HiddenTestForm()
+        expected = "".join(render_field(form[name], exclude="message") for name in form.fields)
+        with mock.patch.object(FieldRenderer, "__init__", autospec=True, side_effect=FieldRenderer.__init__) as init:
+            html = render_form(form, exclude="message")
+        self.assertEqual(init.call_count, 1)
+        self.assertEqual(html, expected)
+        self.assertIn('<input type="hidden" name="tracking" value="abc" id="id_tracking">', html)
+
+    def test_custom_render_gets_hidden_fields(self):
+        field_renderers = {"default": "tests.test_renderers.BracketFieldRenderer"}
+        with self.settings(BOOTSTRAP5={"field_renderers": field_renderers}):
+            html = render_form(HiddenTestForm(), exclude="message")
+        self.assertEqual(html, "[subject][tracking]")
+
+
+class DeprecatedWidgetAttrsTestCase(TestCase):
+    def test_overridden_methods_are_used(self):
+        with self.assertWarns(DeprecationWarning):
+
+            class LegacyFieldRenderer(FieldRenderer):
+                def add_widget_class_attrs(self, widget=None):
+                    super().add_widget_class_attrs(widget)
+                    (widget or self.widget).attrs["class"] += " legacy"
+
+        form = WidgetTestForm()
+        attrs = form.fields["amount"].widget.attrs.copy()
+        with self.assertWarns(DeprecationWarning):
+            html = LegacyFieldRenderer(form["amount"]).render()
+        self.assertIn('class="form-control amount legacy"', html)
+        self.assertIn('<span class="input-group-text">$</span>', html)
+        self.assertEqual(form.fields["amount"].widget.attrs, attrs)
+        with self.assertWarns(DeprecationWarning):
+            html = LegacyFieldRenderer(form["when"]).render()
+        self.assertEqual(html.count("legacy"), 2)
+
+    def test_deprecated_methods_warn(self):
+        renderer = FieldRenderer(WidgetTestForm()["amount"])
+        with self.assertWarns(DeprecationWarning):
+            renderer.add_widget_attrs()
+        self.assertIn("form-control", renderer.widget.attrs["class"])
+        with self.assertWarns(DeprecationWarning):
+            renderer.restore_widget_attrs()
+        self.assertEqual(renderer.widget.attrs["class"], "amount")
+        self.assertFalse(FieldRenderer.uses_deprecated_widget_attrs_methods)
+
+
+class NoFormControlFieldRenderer(FieldRenderer):
+    def is_form_control_widget(self, widget=None):
+        return False
+
+
+class FormControlWidgetTestCase(TestCase):
+    def test_is_form_control_widget_is_used(self):
+        form = WidgetTestForm()
+        renderer = FieldRenderer(form["amount"], layout="floating")
+        self.assertTrue(renderer.can_widget_float(renderer.widget))
+        self.assertTrue(renderer.can_widget_have_addons())
+        renderer = NoFormControlFieldRenderer(form["amount"], layout="floating")
+        self.assertFalse(renderer.can_widget_float(renderer.widget))
+        self.assertFalse(renderer.can_widget_have_addons())
+        self.assertNotIn("input-group", renderer.render())
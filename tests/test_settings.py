@@ -1,6 +1,18 @@
+from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
 
-from django_bootstrap5.core import get_bootstrap_setting
+from django_bootstrap5.core import (
+    get_bootstrap_setting,
+    get_bootstrap_settings,
+    get_field_renderer,
+    get_form_renderer,
+    preload_renderers,
+)
+from django_bootstrap5.renderers import FieldRenderer, FormRenderer
+
+
+class CustomFieldRenderer(FieldRenderer):
+    pass
 
 
 class SettingsTestCase(TestCase):
@@ -9,3 +21,41 @@ class SettingsTestCase(TestCase):
         self.assertEqual("not none", get_bootstrap_setting("SETTING_DOES_NOT_EXIST", "not none"))
         with self.settings(BOOTSTRAP5={"SETTING_DOES_NOT_EXIST": "exists now"}):
             self.assertEqual(get_bootstrap_setting("SETTING_DOES_NOT_EXIST"), "exists now")
+
+    def test_get_bootstrap_settings(self):
+        bootstrap_settings = get_bootstrap_settings()
+        self.assertIs(get_bootstrap_settings(), bootstrap_settings)
+        self.assertEqual(bootstrap_settings.wrapper_class, "mb-3")
+        self.assertEqual(bootstrap_settings.required_css_class, "django_bootstrap5-req")
+        with self.assertRaises(AttributeError):
+            bootstrap_settings.wrapper_class = "mb-5"
+
+    def test_get_bootstrap_settings_reset_on_setting_changed(self):
+        bootstrap_settings = get_bootstrap_settings()
+        with self.settings(BOOTSTRAP5={"wrapper_class": "mb-5"}):
+            self.assertEqual(get_bootstrap_settings().wrapper_class, "mb-5")
+            self.assertEqual(get_bootstrap_settings().required_css_class, "")
+        self.assertIsNot(get_bootstrap_settings(), bootstrap_settings)
+        self.assertEqual(get_bootstrap_settings().wrapper_class, "mb-3")
+
+    def test_get_renderer_cache(self):
+        self.assertIs(get_form_renderer(), FormRenderer)
+        self.assertIs(get_field_renderer(layout="horizontal"), FieldRenderer)
+        field_renderers = {
+            "default": "django_bootstrap5.renderers.FieldRenderer",
+            "custom": "tests.test_settings.CustomFieldRenderer",
+        }
+        with self.settings(BOOTSTRAP5={"field_renderers": field_renderers}):
+            self.assertIs(get_field_renderer(layout="custom"), CustomFieldRenderer)
+            self.assertIs(get_field_renderer(layout="horizontal"), FieldRenderer)
+        self.assertIs(get_field_renderer(layout="custom"), FieldRenderer)
+
+    def test_preload_renderers(self):
+        preload_renderers()
+        field_renderers = {
+            "default": "django_bootstrap5.renderers.FieldRenderer",
+            "broken": "tests.test_settings.DoesNotExist",
+        }
+        with self.settings(BOOTSTRAP5={"field_renderers": field_renderers}):
+            with self.assertRaisesMessage(ImproperlyConfigured, 'layout "broken"'):
+                preload_renderers()
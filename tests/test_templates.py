@@ -1,3 +1,11 @@
+from unittest import mock
+
+from django import forms
+from django.template.loader import get_template
+
+from django_bootstrap5.forms import render_field, render_form, render_formset
+from django_bootstrap5.renderers import FieldRenderer, FormRenderer
+from django_bootstrap5.utils import get_cached_template, is_default_template, render_template_file
 from tests.base import BootstrapTestCase
 
 
@@ -34,3 +42,104 @@ class TemplateTestCase(BootstrapTestCase):
             load_bootstrap=False,
         )
         self.assertIn("x-content-x", html)
+
+
+class CachedTemplateTestCase(BootstrapTestCase):
+    def test_get_cached_template(self):
+        template = get_cached_template("django_bootstrap5/field_errors.html")
+        self.assertIs(get_cached_template("django_bootstrap5/field_errors.html"), template)
+        with self.settings(BOOTSTRAP5={}):
+            self.assertIsNot(get_cached_template("django_bootstrap5/field_errors.html"), template)
+
+    def test_template_loaded_once(self):
+        class HelpTextTestForm(forms.Form):
+            subject = forms.CharField(help_text="Help")
+
+        with self.settings(BOOTSTRAP5={}):
+            with mock.patch("django_bootstrap5.utils.get_template", wraps=get_template) as mock_get_template:
+                for _ in range(3):
+                    render_field(HelpTextTestForm()["subject"])
+            mock_get_template.assert_called_once_with("django_bootstrap5/field_help_text.html")
+
+
+class PythonFragmentTestForm(forms.Form):
+    subject = forms.CharField(help_text='Say <b>"hi"</b> & more', max_length=3)
+    message = forms.CharField(help_text="Message help")
+
+    def clean(self):
+        raise forms.ValidationError(['Form error with <script> & "quotes"', "Second error"])
+
+
+def get_overridden_templates(templates):
+    """Return TEMPLATES setting with given templates overridden."""
+    return [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {
+                "loaders": [
+                    ("django.template.loaders.locmem.Loader", templates),
+                    "django.template.loaders.app_directories.Loader",
+                ],
+            },
+        }
+    ]
+
+
+class PythonFragmentTestCase(BootstrapTestCase):
+    def get_bound_form(self):
+        return PythonFragmentTestForm({"subject": "<b>too long</b>"})
+
+    def test_is_default_template(self):
+        self.assertTrue(is_default_template("django_bootstrap5/field_errors.html"))
+        with self.settings(TEMPLATES=get_overridden_templates({"django_bootstrap5/field_errors.html": "custom"})):
+            self.assertFalse(is_default_template("django_bootstrap5/field_errors.html"))
+            self.assertTrue(is_default_template("django_bootstrap5/field_help_text.html"))
+
+    def test_field_help_text_identical(self):
+        field = self.get_bound_form()["subject"]
+        renderer = FieldRenderer(field)
+        expected = render_template_file(
+            renderer.field_help_text_template,
+            context={"field": field, "help_text": renderer.help_text, "id_help_text": "id_subject_helptext"},
+        )
+        self.assertEqual(renderer.get_help_html(), expected)
+
+    def test_field_errors_identical(self):
+        field = self.get_bound_form()["subject"]
+        renderer = FieldRenderer(field)
+        self.assertEqual(len(renderer.field_errors), 1)
+        expected = render_template_file(
+            renderer.field_errors_template, context={"field": field, "field_errors": renderer.field_errors}
+        )
+        self.assertEqual(renderer.get_errors_html(), expected)
+
+    def test_form_errors_identical(self):
+        form = self.get_bound_form()
+        renderer = FormRenderer(form)
+        errors = renderer.get_fields_errors() + form.non_field_errors()
+        expected = render_template_file(renderer.form_errors_template, context={"errors": errors, "form": form})
+        self.assertEqual(renderer.render_errors(), expected)
+
+    def test_overridden_templates_are_used(self):
+        templates = {
+            "django_bootstrap5/field_errors.html": "[field errors: {{ field_errors|join:',' }}]",
+            "django_bootstrap5/field_help_text.html": "[help: {{ help_text }}]",
+            "django_bootstrap5/form_errors.html": "[form errors: {{ errors|length }}]",
+        }
+        with self.settings(TEMPLATES=get_overridden_templates(templates)):
+            form = self.get_bound_form()
+            html = render_form(form, alert_error_type="all")
+            self.assertIn("[form errors: 4]", html)
+            self.assertIn("[help: Message help]", html)
+            self.assertIn("[field errors: This field is required.]", html)
+            self.assertIn("[form errors: 1]", render_formset(forms.formset_factory(PythonFragmentTestForm)({})))
+
+    def test_custom_renderer_template_is_used(self):
+        class CustomFieldRenderer(FieldRenderer):
+            field_help_text_template = "django_bootstrap5/custom_help_text.html"
+
+        templates = {"django_bootstrap5/custom_help_text.html": "[custom help: {{ help_text }}]"}
+        with self.settings(TEMPLATES=get_overridden_templates(templates)):
+            self.assertEqual(
+                CustomFieldRenderer(self.get_bound_form()["message"]).get_help_html(), "[custom help: Message help]"
+            )
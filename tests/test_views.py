@@ -0,0 +1,55 @@
+from django import forms
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory, TestCase
+
+from django_bootstrap5.forms import render_formset_forms
+from django_bootstrap5.views import FormsetWindowView
+
+
+class TestForm(forms.Form):
+    subject = forms.CharField()
+
+
+TestFormSet = forms.formset_factory(TestForm, extra=0)
+
+
+class TestFormsetWindowView(FormsetWindowView):
+    formset_class = TestFormSet
+    render_kwargs = {"layout": "horizontal"}
+    max_window = 10
+
+    def get_formset_kwargs(self):
+        return {"initial": [{"subject": f"Subject {i}"} for i in range(25)]}
+
+
+class FormsetWindowViewTestCase(TestCase):
+    def get(self, view_class=TestFormsetWindowView, **params):
+        request = RequestFactory().get("/rows/", params)
+        return view_class.as_view()(request)
+
+    def test_window(self):
+        response = self.get(start=10, stop=20)
+        self.assertEqual(response.status_code, 200)
+        formset = TestFormsetWindowView().get_formset()
+        self.assertEqual(
+            response.content.decode(), render_formset_forms(formset, layout="horizontal", start=10, stop=20)
+        )
+        self.assertNotIn("TOTAL_FORMS", response.content.decode())
+        self.assertEqual(response["X-Formset-Total-Forms"], "20")
+        self.assertEqual(response["X-Formset-Initial-Forms"], "20")
+        self.assertEqual(response["X-Formset-Remaining-Forms"], "5")
+
+    def test_last_window(self):
+        response = self.get(start=20)
+        self.assertIn('name="form-24-subject"', response.content.decode())
+        self.assertEqual(response["X-Formset-Total-Forms"], "25")
+        self.assertEqual(response["X-Formset-Remaining-Forms"], "0")
+
+    def test_invalid_window(self):
+        for params in ({"start": "a"}, {"start": -1}, {"start": 5, "stop": 4}, {"start": 0, "stop": 11}):
+            with self.subTest(params=params):
+                self.assertEqual(self.get(**params).status_code, 400)
+
+    def test_missing_formset_class(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self.get(view_class=FormsetWindowView)
@@ -0,0 +1,291 @@
+from django import forms
+from django.forms.renderers import Jinja2, TemplatesSetting
+from django.test import TestCase
+from django.utils.translation import gettext_lazy
+
+from django_bootstrap5.forms import render_field
+from django_bootstrap5.renderers import FieldRenderer
+from django_bootstrap5.widgets import (
+    RadioSelectButtonGroup,
+    WidgetPlan,
+    get_widget_html_renderer,
+    get_widget_plan,
+    register_widget_plan,
+    unregister_widget_plan,
+)
+
+from .test_templates import get_overridden_templates
+
+
+class StarRatingWidget(forms.Widget):
+    template_name = "django/forms/widgets/text.html"
+    input_type = "text"
+
+
+class WidgetPlanTestCase(TestCase):
+    def test_text_input(self):
+        plan = get_widget_plan(forms.TextInput())
+        self.assertEqual(plan.base_classes, ("form-control",))
+        self.assertEqual(plan.size_prefix, "form-control")
+        self.assertTrue(plan.is_form_control)
+        self.assertTrue(plan.can_float)
+        self.assertTrue(plan.can_have_addons)
+        self.assertTrue(plan.can_have_placeholder)
+        self.assertIsNone(plan.template_name)
+
+    def test_input_type(self):
+        self.assertEqual(
+            get_widget_plan(forms.TextInput(attrs={"type": "color"})).base_classes[-1], "form-control-color"
+        )
+        self.assertEqual(get_widget_plan(forms.TextInput(attrs={"type": "range"})).base_classes, ("form-range",))
+        self.assertFalse(get_widget_plan(forms.TextInput(attrs={"type": "color"})).can_have_server_side_validation)
+
+    def test_select(self):
+        plan = get_widget_plan(forms.Select())
+        self.assertEqual(plan.base_classes, ("form-select",))
+        self.assertTrue(plan.can_float)
+        self.assertTrue(plan.float_requires_default_size)
+        self.assertFalse(get_widget_plan(forms.SelectMultiple()).can_have_addons)
+
+    def test_radio_select(self):
+        self.assertEqual(
+            get_widget_plan(forms.RadioSelect()).template_name, "django_bootstrap5/widgets/radio_select.html"
+        )
+        plan = get_widget_plan(RadioSelectButtonGroup())
+        self.assertIsNone(plan.template_name)
+        self.assertTrue(plan.has_button_size_class)
+
+    def test_checkbox(self):
+        plan = get_widget_plan(forms.CheckboxInput())
+        self.assertTrue(plan.is_checkbox)
+        self.assertEqual(plan.base_classes, ("form-check-input",))
+
+    def test_cached(self):
+        self.assertIs(get_widget_plan(forms.TextInput()), get_widget_plan(forms.TextInput()))
+
+    def test_register_widget_plan(self):
+        class StarRatingForm(forms.Form):
+            rating = forms.CharField(widget=StarRatingWidget)
+
+        self.assertEqual(get_widget_plan(StarRatingWidget()).base_classes, ())
+        try:
+            register_widget_plan(StarRatingWidget, WidgetPlan(base_classes=("star-rating",), can_have_addons=True))
+            self.assertEqual(get_widget_plan(StarRatingWidget()).base_classes, ("star-rating",))
+            html = render_field(StarRatingForm()["rating"], addon_before="*")
+            self.assertIn('class="star-rating"', html)
+            self.assertIn('<span class="input-group-text">*</span>', html)
+        finally:
+            unregister_widget_plan(StarRatingWidget)
+        self.assertEqual(get_widget_plan(StarRatingWidget()).base_classes, ())
+
+
+class PairField(forms.MultiValueField):
+    def __init__(self, **kwargs):
+        fields = (forms.CharField(), forms.CharField())
+        widget = forms.MultiWidget(
+            widgets=[forms.TextInput(attrs={"class": "first", "data-pair": "<1>"}), forms.Textarea(attrs={"rows": 2})]
+        )
+        super().__init__(fields, widget=widget, **kwargs)
+
+    def compress(self, data_list):
+        return " ".join(data_list)
+
+
+class PythonWidgetForm(forms.Form):
+    text = forms.CharField(help_text="Text <help>", widget=forms.TextInput(attrs={"data-text": 'a "quote"'}))
+    email = forms.EmailField(required=False)
+    number = forms.DecimalField(localize=True)
+    password = forms.CharField(widget=forms.PasswordInput(render_value=True))
+    url = forms.URLField(widget=forms.URLInput(attrs={"addon_before": "https://"}))
+    date = forms.DateField(widget=forms.DateInput(attrs={"type": "date"}))
+    datetime = forms.DateTimeField(required=False)
+    time = forms.TimeField(disabled=True, initial="12:00")
+    checkbox = forms.BooleanField(required=False)
+    hidden = forms.CharField(widget=forms.HiddenInput, required=False)
+    textarea = forms.CharField(widget=forms.Textarea(attrs={"readonly": True, "hidden": False}))
+    select = forms.ChoiceField(
+        choices=[
+            ("", "---------"),
+            ("a", "A & B"),
+            ("Group <1>", [("b", "<b>"), (1000, 1000), ("c", gettext_lazy("Lazy"))]),
+            ("Group 2", [("d", "D")]),
+        ]
+    )
+    split_datetime = forms.SplitDateTimeField(required=False)
+    pair = PairField(initial=["a & b", "<c>"])
+    select_multiple = forms.MultipleChoiceField(
+        required=False, choices=[(i, f"Option {i}") for i in range(5)], widget=forms.SelectMultiple(attrs={"size": 3})
+    )
+
+
+class PythonWidgetRenderingTestCase(TestCase):
+    def render_all(self, form, **kwargs):
+        return {name: render_field(form[name], **kwargs) for name in form.fields}
+
+    def assertSameHtml(self, form, **kwargs):
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": False}):
+            expected = self.render_all(form, **kwargs)
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            actual = self.render_all(form, **kwargs)
+        for name in form.fields:
+            self.assertEqual(actual[name], expected[name], name)
+
+    def test_unbound(self):
+        self.assertSameHtml(PythonWidgetForm())
+
+    def test_bound(self):
+        data = {
+            "text": '<b>Bold</b> & "quoted"',
+            "email": "not-an-email",
+            "number": "1234.5",
+            "password": "s3cr3t'",
+            "url": "https://example.com/?a=1&b=2",
+            "date": "2024-02-30",
+            "time": "13:00",
+            "checkbox": "on",
+            "hidden": "<hidden>",
+            "textarea": "\nLine 1\n<Line 2>",
+            "select": "b",
+            "select_multiple": ["1", "3"],
+            "split_datetime_0": "2024-01-02",
+            "split_datetime_1": "invalid <time>",
+            "pair_0": "",
+            "pair_1": "\n",
+        }
+        self.assertSameHtml(PythonWidgetForm(data=data))
+        self.assertSameHtml(PythonWidgetForm(data={}))
+
+    def test_layouts(self):
+        form = PythonWidgetForm(data={"text": "text"})
+        self.assertSameHtml(form, layout="floating")
+        self.assertSameHtml(form, layout="horizontal", size="sm")
+        self.assertSameHtml(form, show_label=False, set_placeholder=False)
+
+    def test_select(self):
+        self.assertSameHtml(PythonWidgetForm(data={"select": "1000"}))
+        self.assertSameHtml(PythonWidgetForm(data={"select": "not a choice", "select_multiple": ["9"]}))
+        self.assertSameHtml(PythonWidgetForm(data={"select_multiple": "2"}), layout="floating")
+        with self.settings(USE_THOUSAND_SEPARATOR=True):
+            self.assertSameHtml(PythonWidgetForm(data={"select": "1000"}))
+
+    def test_multi_widget(self):
+        form = PythonWidgetForm(data={"split_datetime_0": "2024-01-02", "split_datetime_1": "10:00"})
+        with self.settings(USE_THOUSAND_SEPARATOR=True):
+            self.assertSameHtml(form, layout="floating")
+        field = form["pair"]
+        renderer = FieldRenderer(field)
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            self.assertEqual(len(renderer.get_multi_widget_html_renderers(renderer.widget)), 2)
+            renderer.render()
+        self.assertEqual(
+            [subwidget.attrs for subwidget in field.field.widget.widgets],
+            [{"class": "first", "data-pair": "<1>"}, {"cols": "40", "rows": 2}],
+        )
+        self.assertIsNone(renderer.get_multi_widget_html_renderers(renderer.widget))
+
+    def test_auto_id(self):
+        self.assertSameHtml(PythonWidgetForm(auto_id=False))
+        self.assertSameHtml(PythonWidgetForm(auto_id="field_%s", prefix="prefix"))
+
+    def test_widget_html_renderer(self):
+        self.assertIsNotNone(get_widget_html_renderer(forms.TextInput()))
+        self.assertIsNotNone(get_widget_html_renderer(forms.Textarea()))
+        self.assertIsNotNone(get_widget_html_renderer(forms.Select()))
+        self.assertIsNone(get_widget_html_renderer(forms.RadioSelect()))
+        self.assertIsNone(get_widget_html_renderer(StarRatingWidget()))
+
+        class CustomTextInput(forms.TextInput):
+            pass
+
+        self.assertIsNone(get_widget_html_renderer(CustomTextInput()))
+
+        widget = forms.TextInput()
+        widget.template_name = "custom/text.html"
+        self.assertIsNone(get_widget_html_renderer(widget))
+
+        widget = forms.Select()
+        widget.option_template_name = "custom/option.html"
+        self.assertIsNone(get_widget_html_renderer(widget))
+
+    def test_form_renderer(self):
+        field = PythonWidgetForm(renderer=TemplatesSetting())["text"]
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            renderer = FieldRenderer(field)
+            self.assertIsNone(renderer.get_widget_html_renderer(field.field.widget))
+            field = PythonWidgetForm()["text"]
+            renderer = FieldRenderer(field)
+            self.assertIsNotNone(renderer.get_widget_html_renderer(field.field.widget))
+        renderer = FieldRenderer(field)
+        self.assertIsNone(renderer.get_widget_html_renderer(field.field.widget))
+
+    def test_jinja2_form_renderer(self):
+        form = PythonWidgetForm(renderer=Jinja2())
+        with self.settings(BOOTSTRAP5={"python_widget_rendering": True}):
+            for name in ("text", "select"):
+                renderer = FieldRenderer(form[name])
+                self.assertIsNone(renderer.get_widget_html_renderer(renderer.widget))
+                self.assertEqual(renderer.render(), TemplateFieldRenderer(form[name]).render())
+
+
+class TemplateFieldRenderer(FieldRenderer):
+    def get_widget_html_renderer(self, widget):
+        return None
+
+
+class CustomOptionRadioSelect(forms.RadioSelect):
+    def create_option(self, *args, **kwargs):
+        option = super().create_option(*args, **kwargs)
+        option["attrs"]["data-total"] = f"<{option['value']}>"
+        return option
+
+
+class RadioForm(forms.Form):
+    radio = forms.ChoiceField(
+        choices=[("1", "One & only"), ("Group", [("2", "<Two>"), (3, "Three")])],
+        widget=forms.RadioSelect(attrs={"data-radio": True}),
+    )
+    checkboxes = forms.MultipleChoiceField(
+        required=False, choices=[(i, f"Option {i}") for i in range(4)], widget=forms.CheckboxSelectMultiple
+    )
+    custom = forms.ChoiceField(required=False, choices=[("a", "A"), ("b", "B")], widget=CustomOptionRadioSelect)
+    button_group = forms.ChoiceField(choices=[("x", "X"), ("y", "<Y>")], widget=RadioSelectButtonGroup)
+    disabled_button_group = forms.ChoiceField(
+        disabled=True, required=False, choices=[(None, "None"), ("z", "Z")], widget=RadioSelectButtonGroup
+    )
+
+
+class PythonTemplateRenderingTestCase(TestCase):
+    def assertSameHtml(self, form, **kwargs):
+        for name in form.fields:
+            renderer = FieldRenderer(form[name])
+            self.assertIsNotNone(renderer.get_widget_html_renderer(renderer.get_widget_for_render(renderer.widget)))
+            self.assertEqual(
+                FieldRenderer(form[name], **kwargs).render(), TemplateFieldRenderer(form[name], **kwargs).render(), name
+            )
+
+    def test_unbound(self):
+        self.assertSameHtml(RadioForm())
+        self.assertSameHtml(RadioForm(auto_id=False))
+
+    def test_bound(self):
+        self.assertSameHtml(
+            RadioForm(data={"radio": "3", "checkboxes": ["1", "2"], "custom": "b", "button_group": "y"})
+        )
+        self.assertSameHtml(RadioForm(data={"radio": "9", "checkboxes": ["9"], "button_group": "9"}))
+
+    def test_layouts(self):
+        form = RadioForm(data={"radio": "1"})
+        self.assertSameHtml(form, layout="horizontal", size="lg")
+        self.assertSameHtml(form, layout="inline", server_side_validation=False)
+        self.assertSameHtml(form, size="sm", checkbox_layout="inline")
+
+    def test_overridden_template(self):
+        field = RadioForm(renderer=TemplatesSetting())["radio"]
+        renderer = FieldRenderer(field)
+        widget = renderer.get_widget_for_render(renderer.widget)
+        self.assertIsNotNone(renderer.get_widget_html_renderer(widget))
+        with self.settings(
+            TEMPLATES=get_overridden_templates({"django_bootstrap5/widgets/radio_select.html": "custom radios"})
+        ):
+            self.assertIsNone(renderer.get_widget_html_renderer(widget))
+            self.assertIn("custom radios", FieldRenderer(field).render())